@@ -1,17 +1,212 @@
+import codecs
 import ctypes
+import mmap
 import os
+import re
 import shlex
 import shutil
 import subprocess
 import threading
+import time
+import uuid
 import winreg
 from ctypes import wintypes
-from typing import Tuple
+from functools import cached_property, lru_cache
+from typing import Any, Dict, NamedTuple, Tuple
 
 from pykernel import kernel32, wslapi
-from pykernel.kernel32 import WaitResult, Overlapped
+from pykernel.advapi32 import RegNotifyFilter, ERROR_SUCCESS, KEY_READ, KEY_WOW64_64KEY, get_advapi32
+from pykernel.kernel32 import WaitResult, Overlapped, ErrorCode, INFINITE, DEFAULT_READ_SIZE
 from pykernel.wslapi import WslHResult, WslDistributionFlags
 
+LXSS_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Lxss"
+
+# (mask, name) of every non-zero WSL_DISTRIBUTION_FLAGS member, built once from the enum
+_WSL_FLAG_NAMES = [
+    (int(flag), name) for name, flag in WslDistributionFlags.__members__.items() if flag.value
+]
+
+
+def _flag_names(raw_flags):
+    """Names of the flags set in a raw WSL_DISTRIBUTION_FLAGS value, ["NONE"] if there are none."""
+    return [name for flag, name in _WSL_FLAG_NAMES if raw_flags & flag] or (["NONE"] if raw_flags == 0 else [])
+
+
+# Marks an mtime that could not be read because \\wsl$ is not reachable
+_UNKNOWN = object()
+
+# Largest stdin_bytes accepted by WSL._start_process: the input is written before the output is read,
+# so it must fit in the stdin pipe buffer or a child that writes before reading all its input deadlocks
+MAX_STDIN_SIZE = DEFAULT_READ_SIZE
+
+# Seconds a queried IP is reused by WSL.get_wsl_ip and WSL.wsl_ip
+WSL_IP_TTL = 5
+
+WSL_CONF_SECTIONS = ('automount', 'network', 'interop', 'user', 'boot', 'useWindowsTimezone', 'systemd')
+WSLCONFIG_SECTIONS = ('wsl2',)
+
+# One match per "[section]" or "key = value" line. "#"/";" only start a comment at the beginning of
+# a line (or after a section header), so values such as "start; echo hi" or "my#host" are kept whole
+_INI_LINE = re.compile(
+    r'^[ \t]*(?:\[(?P<sec>[^\]\r\n]+)\][ \t]*(?:[#;].*)?|(?P<k>[^=;#\s][^=\r\n]*?)[ \t]*=[ \t]*(?P<v>.*?))[ \t\r]*$',
+    re.M
+)
+
+
+class WslConf(NamedTuple):
+    """
+    Parsed /etc/wsl.conf, one {key: value} dict per section.
+
+    Built once per parse so every accessor reads its section as an attribute instead of going
+    through the whole configuration again. get() keeps the dict-style access by section name.
+    """
+    automount: Dict[str, Any]
+    network: Dict[str, Any]
+    interop: Dict[str, Any]
+    user: Dict[str, Any]
+    boot: Dict[str, Any]
+    useWindowsTimezone: Dict[str, Any]
+    systemd: Dict[str, Any]
+
+    def get(self, section, default=None):
+        """Returns the options of a section by name, or default if there is no such section"""
+        return getattr(self, section) if section in self._fields else default
+
+
+def _decode_output(data, decode=True):
+    """Decodes captured subprocess output as UTF-8, leaving None (not captured) untouched"""
+    if data is None or not decode:
+        return data
+    return data.decode("utf-8", errors="replace")
+
+
+def _coerce_ini_value(value):
+    """Converts "true"/"false" to bool and digit strings to int"""
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    if value.isdigit():
+        return int(value)
+    return value
+
+
+def _parse_ini(text, sections):
+    """
+    Parses the content of wsl.conf / .wslconfig into {section: {key: value}}.
+    Section names match case-insensitively and keys are lower-cased; unknown sections are ignored.
+    """
+    config = {section: {} for section in sections}
+    names = {section.lower(): section for section in sections}
+    current = None
+    for match in _INI_LINE.finditer(text):
+        section = match.group('sec')
+        if section is not None:
+            current = config.get(names.get(section.strip().lower()))
+        elif current is not None:
+            current[match.group('k').lower()] = _coerce_ini_value(match.group('v'))
+    return config
+
+
+# Lxss key handle and change notification event shared by every WSL instance
+_lxss_lock = threading.Lock()
+_lxss_watch = None
+
+
+@lru_cache(maxsize=None)
+def _load_lxss_index():
+    """
+    Scans the Lxss registry key once and maps every lower-cased distribution name to its data
+    (GUID, BasePath, Flavor, PackageFamilyName, osVersion).
+    """
+    # Written by every WSL version and read in one call; the optional ones are missing on distros
+    # registered by older WSL releases and are read one by one so that they can not fail the batch
+    required = ["DistributionName", "BasePath", "Version"]
+    # PackageFamilyName is also missing on distros registered with wsl --import
+    optional = ["PackageFamilyName", "Flavor", "osVersion"]
+    fields = required[1:] + optional
+    api = get_advapi32()
+    index = {}
+    # Reused for every subkey
+    name_buffer = ctypes.create_unicode_buffer(256)
+    data_buffer = ctypes.create_string_buffer(1024)
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, LXSS_KEY_PATH) as lxss_key:
+        subkey_count, _, _ = winreg.QueryInfoKey(lxss_key)
+        for i in range(subkey_count):
+            if api.reg_enum_key_ex(lxss_key, i, name_buffer) != ERROR_SUCCESS:
+                break
+            distro_key = api.reg_open_key_ex(lxss_key, name_buffer, KEY_READ | KEY_WOW64_64KEY)
+            try:
+                try:
+                    values = api.reg_query_multiple_values(distro_key, required, data_buffer)
+                    singles = optional
+                except FileNotFoundError:
+                    values = {}
+                    singles = required + optional
+                for field in singles:
+                    try:
+                        values[field] = api.reg_query_value(distro_key, field, data_buffer)
+                    except FileNotFoundError:
+                        continue
+                name = values.get("DistributionName")
+                if not isinstance(name, str):
+                    continue
+                result = {
+                    "BasePath": None,
+                    "Flavor": None,
+                    "GUID": name_buffer.value,
+                    "osVersion": None,
+                    "PackageFamilyName": None
+                }
+                for field in fields:
+                    if field not in values:
+                        continue
+                    if field.lower() in ("version", "osversion"):
+                        result["osVersion"] = values[field]
+                    else:
+                        result[field] = values[field]
+                index[name.lower()] = result
+            finally:
+                api.reg_close_key(distro_key)
+    return index
+
+
+def _invalidate_lxss_index():
+    """Forgets the Lxss index so the next lookup scans the registry again"""
+    _load_lxss_index.cache_clear()
+
+
+def _lxss_index():
+    """Returns the Lxss index, rebuilt if the Lxss key changed since it was built"""
+    global _lxss_watch
+    with _lxss_lock:
+        kernel = kernel32.get_kernel32()
+        if _lxss_watch is not None and kernel.wait_for_single_object(_lxss_watch[1], 0) == WaitResult.TIMEOUT:
+            return _load_lxss_index()
+
+        if _lxss_watch is None:
+            # KEY_READ includes KEY_NOTIFY
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, LXSS_KEY_PATH)
+            try:
+                event = kernel.create_event(manual_reset=False)
+            except OSError:
+                key.Close()
+                raise
+            _lxss_watch = (key, event)
+
+        key, event = _lxss_watch
+        # Armed before scanning so that a change made during the scan is not missed
+        error = get_advapi32().reg_notify_change_key_value(
+            key, event,
+            notify_filter=RegNotifyFilter.NAME | RegNotifyFilter.LAST_SET | RegNotifyFilter.THREAD_AGNOSTIC
+        )
+        if error != ERROR_SUCCESS:
+            _lxss_watch = None
+            key.Close()
+            kernel.close_handle(event)
+            raise ctypes.WinError(error)
+        _invalidate_lxss_index()
+        return _load_lxss_index()
+
 
 # ==================================================
 # API Windows structures
@@ -19,17 +214,58 @@ from pykernel.wslapi import WslHResult, WslDistributionFlags
 
 class WSL:
 
-    def __init__(self, distro='Ubuntu'):
+    def __init__(self, distro='Ubuntu', persistent_shell=False):
+        """
+        Args:
+            distro (str): Name of the WSL distribution.
+            persistent_shell (bool): Run short internal commands through one long-lived
+                `bash -s` instead of launching a new WSL process for each of them.
+        """
         self.distro = distro
-        self.wsl_api = wslapi.WslAPI()
-        self.kernel32py = kernel32.Kernel32()
+        self.persistent_shell = persistent_shell
+        self._shell = None
+        # Distribution configuration, read once and updated by configure_distribution
+        self._config_cache = None
+        # Last queried IP and when it was queried, reused for WSL_IP_TTL seconds
+        self._wsl_ip = None
+        self._wsl_ip_time = 0.0
+        # wslpath results for relative paths, by (distro, Windows cwd, path)
+        self._wslpath_cache = {}
+        # Parsed configuration files, reused while their mtime does not change
+        self._wslconf_cache = None
+        self._wslconf_mtime = None
+        self._wslconfig_cache = None
+        self._wslconfig_mtime = None
+        self._wslconfig_bytes = None
+        # (name, list command) of the package manager, once one is found
+        self._pkg_manager = None
+
+    # The DLL wrappers are only loaded when a method first needs them, so reading .wslconfig never
+    # loads wslapi.dll
+    @cached_property
+    def wsl_api(self):
+        return wslapi.get_wslapi()
+
+    @cached_property
+    def kernel32py(self):
+        return kernel32.get_kernel32()
 
     def get_distribution_configuration(self):
+        """
+        Returns the distribution configuration as a dict, or None if it can not be read.
+        The result is queried once and kept up to date by configure_distribution; call
+        invalidate_config() if the distribution is reconfigured by other means. The returned
+        dict is shared with the cache and must not be modified.
+        """
+        if self._config_cache is not None:
+            return self._config_cache
+
         config = {
             'name': self.distro,
             'version': None,
             'default_uid': None,
             'flags': None,
+            'flag_names': [],
             'env_vars': {}
         }
 
@@ -39,58 +275,27 @@ class WSL:
             config['version'] = configuration.version
             config['default_uid'] = configuration.uid
             config['flags'] = configuration.flags
-            if config['flags'] & WslDistributionFlags.ENABLE_INTEROP:
-                print("ENABLE_INTEROP")
-            if config['flags'] & WslDistributionFlags.APPEND_NT_PATH:
-                print("APPEND_NT_PATH")
-            if config['flags'] & WslDistributionFlags.ENABLE_DRIVE_MOUNTING:
-                print("ENABLE_DRIVE_MOUNTING")
-            if config['flags'] == WslDistributionFlags.NONE:
-                print("NONE")
+            config['flag_names'] = _flag_names(configuration.raw_flags)
 
             config['env_vars'] = configuration.env_vars
 
-        return config if h_result == WslHResult.S_OK else None
+        if h_result != WslHResult.S_OK:
+            return None
+        self._config_cache = config
+        return config
+
+    def invalidate_config(self):
+        """Drop the cached distribution configuration so the next read queries WSL again."""
+        self._config_cache = None
 
     def get_wsl_distro_info_by_name(self):
         """
         Returns a dictionary with the requested data for the WSL distribution whose name matches distro_name.
         If not found, returns None.
+        The registry is scanned once per process and again only after the Lxss key changes.
         """
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Lxss"
-        fields = ["BasePath", "Flavor", "PackageFamilyName", "Version", "osVersion"]
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as lxss_key:
-                i = 0
-                while True:
-                    try:
-                        guid = winreg.EnumKey(lxss_key, i)
-                        with winreg.OpenKey(lxss_key, guid) as distro_key:
-                            try:
-                                name = winreg.QueryValueEx(distro_key, "DistributionName")[0]
-                            except FileNotFoundError:
-                                name = None
-                            if isinstance(name, str) and name.lower() == self.distro.lower():
-                                result = {
-                                    "BasePath": None,
-                                    "Flavor": None,
-                                    "GUID": guid,
-                                    "osVersion": None,
-                                    "PackageFamilyName": None
-                                }
-                                for field in fields:
-                                    try:
-                                        value = winreg.QueryValueEx(distro_key, field)[0]
-                                        if field.lower() in ("version", "osversion"):
-                                            result["osVersion"] = value
-                                        else:
-                                            result[field] = value
-                                    except FileNotFoundError:
-                                        continue
-                                return result
-                        i += 1
-                    except OSError:
-                        break
+            return _lxss_index().get(self.distro.lower())
         except Exception as e:
             print(f"Error accesing registry: {e}")
         return None
@@ -106,15 +311,27 @@ class WSL:
             flags (WslDistributionFlags): Configuration flags
         
         """
-        current_config = self.get_distribution_configuration()
-
-        # Keep current values if not specified
-        final_uid = default_uid if default_uid is not None else current_config['default_uid']
-        final_flags = flags if flags is not None else current_config['flags']
+        final_uid, final_flags = default_uid, flags
+
+        # Keep current values if not specified; nothing to read when both are given
+        if default_uid is None or flags is None:
+            current_config = self.get_distribution_configuration()
+            if final_uid is None:
+                final_uid = current_config['default_uid']
+            if final_flags is None:
+                final_flags = current_config['flags']
+
+        if self.wsl_api.wsl_configure_distribution(
+                distribution_name=self.distro, uid=final_uid, flags=final_flags
+        ) != WslHResult.S_OK:
+            return False
 
-        return self.wsl_api.wsl_configure_distribution(
-            distribution_name=self.distro, uid=final_uid, flags=final_flags
-        ) == WslHResult.S_OK
+        # Keep the cached configuration in step instead of querying it again
+        if self._config_cache is not None:
+            self._config_cache['default_uid'] = final_uid
+            self._config_cache['flags'] = WslDistributionFlags(final_flags)
+            self._config_cache['flag_names'] = _flag_names(int(final_flags))
+        return True
 
     def set_distribution_flag(self, flag: WslDistributionFlags, enable: bool):
         """"Modify a specific flag while keeping the others unchanged"""
@@ -142,9 +359,12 @@ class WSL:
         Returns:
         bool: True if registration was successful, False if it faileda
         """
-        return self.wsl_api.wsl_register_distribution(
+        registered = self.wsl_api.wsl_register_distribution(
             distribution_name=distribution_name, tar_gz_path=tar_gz_path
         ) == WslHResult.S_OK
+        if registered:
+            _invalidate_lxss_index()
+        return registered
 
     def unregister_distribution(self, distribution_name: str) -> bool:
         """
@@ -155,18 +375,29 @@ class WSL:
         Returns:
             bool: True if the operation was successful
         """
-        return self.wsl_api.wsl_unregister_distribution(distribution_name=distribution_name) == WslHResult.S_OK
+        unregistered = self.wsl_api.wsl_unregister_distribution(distribution_name=distribution_name) == WslHResult.S_OK
+        if unregistered:
+            _invalidate_lxss_index()
+        return unregistered
 
-    def is_distribution_registered(self, distribution_name: str) -> bool:
+    def is_distribution_registered(self, distribution_name: str, force_native: bool = False) -> bool:
         """
         Checks if a distribution is registered.
+        Answered from the Lxss index, which is rebuilt whenever the Lxss key changes, so no DLL call
+        is made; falls back to wslapi.dll if the registry can not be read.
 
         Args:
         distribution_name: Name of the distribution to check
+        force_native: Ask wslapi.dll (WslIsDistributionRegistered) instead of the registry
 
         Returns:
         bool: True if the distribution is registered
         """
+        if not force_native:
+            try:
+                return distribution_name.lower() in _lxss_index()
+            except OSError:
+                pass
         return bool(self.wsl_api.wsl_is_distribution_registered(distribution_name))
 
     def launch_interactive(self, command: str = None, use_current_working_directory: bool = True) -> dict:
@@ -193,97 +424,343 @@ class WSL:
         }
 
     def _create_pipe(self) -> Tuple[wintypes.HANDLE, wintypes.HANDLE]:
-        """Create an anonymous pipe with handle inheritance"""
-        return self.kernel32py.create_pipe()
+        """Create a pipe with an overlapped read end and an inheritable write end"""
+        return self.kernel32py.create_overlapped_pipe()
 
-    def _read_pipe_async(self, handle):
-        """Read data from a pipe asynchronously."""
-        buffer = ctypes.create_string_buffer(4096)
-        overlapped = Overlapped()
-        output = b""
-
-        while True:
-            success = self.kernel32py.read_file(pipe_handle=handle, buffer=buffer, overlapped=overlapped)
-
-            if not success and ctypes.get_last_error() != 997:  # ERROR_IO_PENDING
-                break
-
-            n_bytes_transferred = self.kernel32py.get_overlapped_result(pipe_handle=handle, overlapped=overlapped)
-            if n_bytes_transferred == 0:
-                break
+    def _start_read(self, handle, buffer, overlapped) -> bool:
+        """Issue an overlapped read on a pipe. Returns False when the pipe has no more data."""
+        if self.kernel32py.read_file(pipe_handle=handle, buffer=buffer, overlapped=overlapped):
+            return True
+        return ctypes.get_last_error() == ErrorCode.IO_PENDING
 
-            output += buffer[:n_bytes_transferred]
+    def _drain(self, handle, overlapped) -> bytes:
+        """Read whatever is queued in a pipe in one call; empty once the writer is gone."""
+        try:
+            return self.kernel32py.drain_pipe(handle, overlapped=overlapped)
+        except OSError as e:
+            if e.winerror in (ErrorCode.BROKEN_PIPE, ErrorCode.HANDLE_EOF):
+                return b""
+            raise
 
-        return output
+    def _iter_pipes(self, pipe_handles, process_handle, timeout=30000):
+        """
+        Read every pipe until EOF and then wait for the process, without helper threads.
 
-    def _launch_process(self, command):
-        """Execute a command using the native API with timeout handling."""
-        stdout_read, stdout_write = self._create_pipe()
-        stderr_read, stderr_write = self._create_pipe()
-        process_handle = wintypes.HANDLE()
+        The pipes are attached to one I/O completion port, keyed by their index, and each has an
+        overlapped read in flight; completions are dispatched from a single poll loop.
+        Yields (pipe index, chunk) as data arrives and, last, (None, exit code), where the exit code
+        is -1 on timeout and -2 if the wait failed. The process is terminated if the generator is
+        closed before it exits.
+        """
+        pool = self.kernel32py.buffer_pool
+        buffers, overlappeds = zip(*(pool.acquire() for _ in pipe_handles))
+        port = kernel32.CompletionPort(self.kernel32py)
+        # Draining reads complete synchronously and must not queue a packet to the port: a handle with
+        # its low-order bit set in hEvent keeps the completion out of it
+        drain_event = self.kernel32py.create_event()
+        drain_overlapped = Overlapped()
+        drain_overlapped.hEvent = drain_event.value | 1
+        pending = []
+        exit_code = None
+        deadline = time.monotonic() + timeout / 1000
 
         try:
-            # Lanzar proceso
+            for i, handle in enumerate(pipe_handles):
+                port.attach(handle, i)
+                if self._start_read(handle, buffers[i], overlappeds[i]):
+                    pending.append(i)
+
+            while pending:
+                remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                n_bytes_transferred, i, overlapped, error = port.poll(remaining)
+
+                if overlapped is None:
+                    # Time-out or the port failed
+                    self.kernel32py.terminate_process(process_handle=process_handle)
+                    exit_code = -1 if error == ErrorCode.WAIT_TIMEOUT else -2
+                    break
+
+                if error:
+                    if error not in (ErrorCode.BROKEN_PIPE, ErrorCode.HANDLE_EOF):
+                        raise kernel32.Kernel32Error(error)
+                    pending.remove(i)
+                    continue
 
-            hr = self.wsl_api.wsl_launch(
-                distribution_name=self.distro, command=command, std_in=wintypes.HANDLE(0), std_out=stdout_write,
-                std_err=stderr_write, process_handle=process_handle
-            )
+                chunk = buffers[i][:n_bytes_transferred]
+                if n_bytes_transferred == len(buffers[i]):
+                    # A full buffer means more is probably queued: take all of it in one read
+                    chunk += self._drain(pipe_handles[i], drain_overlapped)
+                if not self._start_read(pipe_handles[i], buffers[i], overlappeds[i]):
+                    pending.remove(i)
+                yield i, chunk
+
+            if exit_code is None:
+                remaining = max(0, int((deadline - time.monotonic()) * 1000))
+                result = self.kernel32py.wait_for_single_object(process_handle=process_handle, timeout=remaining)
+                if result == WaitResult.OBJECT_0:
+                    exit_code = self.kernel32py.get_exit_code_process(process_handle=process_handle)
+                else:
+                    self.kernel32py.terminate_process(process_handle=process_handle)
+                    exit_code = -1 if result == WaitResult.TIMEOUT else -2
+        finally:
+            if exit_code is None:
+                self.kernel32py.terminate_process(process_handle=process_handle)
+            # Buffers and OVERLAPPED structures must outlive any read still in flight
+            for i in pending:
+                self.kernel32py.cancel_io(pipe_handles[i])
+                try:
+                    self.kernel32py.get_overlapped_result(pipe_handle=pipe_handles[i], overlapped=overlappeds[i])
+                except OSError:
+                    pass
+            port.close()
+            self.kernel32py.close_handle(pipe_handle=drain_event)
+            for buffer, overlapped in zip(buffers, overlappeds):
+                pool.release(buffer, overlapped)
+
+        yield None, exit_code
+
+    def _start_process(self, command, stdin_bytes=None):
+        """
+        Launch a command with the native API, its stdout and stderr connected to new pipes.
+        If stdin_bytes is given it is written to the command's stdin, which is then closed; it is
+        written before any output is read, so it is limited to MAX_STDIN_SIZE bytes (the stdin pipe
+        buffer) and a larger input raises ValueError.
+        Returns (hr, stdout_read, stderr_read, process_handle); on failure every handle is closed.
+        """
+        if stdin_bytes is not None and len(stdin_bytes) > MAX_STDIN_SIZE:
+            raise ValueError(f"stdin_bytes is limited to {MAX_STDIN_SIZE} bytes, got {len(stdin_bytes)}")
 
-            if hr != WslHResult.S_OK:
-                return {"hr": hr, "stdout": b"", "stderr": b"", "exit_code": 1}
+        # Every handle is tracked as soon as it exists and set to None once closed, so an error at any
+        # point closes exactly the handles still open
+        opened = []
 
-            # Cerrar extremos de escritura
-            self.kernel32py.close_handle(stdout_write)
-            self.kernel32py.close_handle(stderr_write)
+        def close(handle):
+            self.kernel32py.close_handle(pipe_handle=handle)
+            opened[opened.index(handle)] = None
 
-            # Leer salida en hilos separados
-            stdout_buffer = []
-            stderr_buffer = []
+        stdin_read = stdin_write = None
+        launched = False
+        try:
+            if stdin_bytes is not None:
+                stdin_read, stdin_write = self.kernel32py.create_pipe(MAX_STDIN_SIZE, inherit_write=False)
+                opened += [stdin_read, stdin_write]
+            stdout_read, stdout_write = self._create_pipe()
+            opened += [stdout_read, stdout_write]
+            stderr_read, stderr_write = self._create_pipe()
+            opened += [stderr_read, stderr_write]
+            process_handle = wintypes.HANDLE()
+            opened.append(process_handle)
 
-            stdout_thread = threading.Thread(
-                target=lambda: stdout_buffer.append(self._read_pipe_async(stdout_read))
-            )
-            stderr_thread = threading.Thread(
-                target=lambda: stderr_buffer.append(self._read_pipe_async(stderr_read))
+            hr = self.wsl_api.wsl_launch(
+                distribution_name=self.distro, command=command, std_in=stdin_read or wintypes.HANDLE(0),
+                std_out=stdout_write, std_err=stderr_write, process_handle=process_handle
             )
 
-            stdout_thread.start()
-            stderr_thread.start()
-
-            # Esperar proceso con timeout
-            exit_code = self._wait_for_process(process_handle)
+            # Cerrar los extremos del proceso hijo
+            for handle in (stdin_read, stdout_write, stderr_write):
+                if handle is not None:
+                    close(handle)
+
+            if stdin_write is not None:
+                try:
+                    if hr == WslHResult.S_OK:
+                        self.kernel32py.write_file(stdin_write, stdin_bytes)
+                except OSError:
+                    # The command exited without reading its input
+                    pass
+                close(stdin_write)
+
+            launched = hr == WslHResult.S_OK
+            return hr, stdout_read, stderr_read, process_handle
+        finally:
+            if not launched:
+                for handle in reversed(opened):
+                    if handle:
+                        self.kernel32py.close_handle(pipe_handle=handle)
+
+    def _close_handles(self, *handles):
+        """Close every non-null handle."""
+        for handle in handles:
+            if handle:
+                self.kernel32py.close_handle(pipe_handle=handle)
+
+    def _launch_process(self, command, stdout_sink=None, stderr_sink=None, stdin_bytes=None, timeout=30000):
+        """
+        Execute a command using the native API with timeout handling (milliseconds, INFINITE to disable).
+        When a sink is given it receives that stream chunk by chunk and the stream is returned empty.
+        stdin_bytes, if given, is fed to the command's stdin (at most MAX_STDIN_SIZE bytes).
+        """
+        hr, stdout_read, stderr_read, process_handle = self._start_process(command, stdin_bytes)
+        if hr != WslHResult.S_OK:
+            return {"hr": hr, "stdout": b"", "stderr": b"", "exit_code": 1}
 
-            # Esperar hilos
-            stdout_thread.join()
-            stderr_thread.join()
+        try:
+            stdout_chunks = []
+            stderr_chunks = []
+            sinks = (stdout_sink or stdout_chunks.append, stderr_sink or stderr_chunks.append)
+            exit_code = None
+            for index, data in self._iter_pipes([stdout_read, stderr_read], process_handle, timeout):
+                if index is None:
+                    exit_code = data
+                else:
+                    sinks[index](data)
 
             return {
                 "hr": 0,
-                "stdout": stdout_buffer[0] if stdout_buffer else b"",
-                "stderr": stderr_buffer[0] if stderr_buffer else b"",
+                "stdout": b"".join(stdout_chunks),
+                "stderr": b"".join(stderr_chunks),
                 "exit_code": exit_code
             }
 
         finally:
             # Limpieza de handles
-            handles = [stdout_read, stderr_read, process_handle]
-            for handle in handles:
-                if handle:
-                    self.kernel32py.close_handle(pipe_handle=handle)
+            self._close_handles(stdout_read, stderr_read, process_handle)
 
-    def _wait_for_process(self, process_handle, timeout=30000):
-        """Wait for the process to finish with a maximum timeout."""
-        result = self.kernel32py.wait_for_single_object(process_handle=process_handle, timeout=timeout)
+    def iter_lines(self, command: str, timeout: int = 30000):
+        """
+        Execute a command using the native api and yield its stdout decoded line by line as it is produced.
+        Only one chunk of output is held in memory at a time; stderr is read and discarded.
+        """
+        hr, stdout_read, stderr_read, process_handle = self._start_process(command)
+        if hr != WslHResult.S_OK:
+            return
 
-        if result == WaitResult.OBJECT_0:
-            return self.kernel32py.get_exit_code_process(process_handle=process_handle)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        try:
+            for index, data in self._iter_pipes([stdout_read, stderr_read], process_handle, timeout):
+                if index != 0:
+                    continue
+                pending += decoder.decode(data)
+                *lines, pending = pending.split("\n")
+                yield from lines
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+        finally:
+            self._close_handles(stdout_read, stderr_read, process_handle)
 
-        elif result == WaitResult.TIMEOUT:
-            self.kernel32py.terminate_process(process_handle=process_handle)
-            return -1
-        else:
-            return -2
+    def _get_shell(self):
+        """Start the persistent `bash -s` on first use and return its state."""
+        if self._shell is not None:
+            return self._shell
+
+        # Same bookkeeping as _start_process: a failed launch (WslLaunch raises OSError through its
+        # HRESULT restype) or a failed create_event closes every handle opened so far
+        opened = []
+        started = False
+        try:
+            stdin_read, stdin_write = self.kernel32py.create_pipe(inherit_write=False)
+            opened += [stdin_read, stdin_write]
+            stdout_read, stdout_write = self._create_pipe()
+            opened += [stdout_read, stdout_write]
+            process_handle = wintypes.HANDLE()
+            opened.append(process_handle)
+
+            self.wsl_api.wsl_launch(
+                distribution_name=self.distro, command="bash -s", std_in=stdin_read, std_out=stdout_write,
+                std_err=stdout_write, process_handle=process_handle
+            )
+
+            # The child has its own copies of these ends
+            for handle in (stdin_read, stdout_write):
+                self.kernel32py.close_handle(handle)
+                opened[opened.index(handle)] = None
+
+            overlapped = Overlapped()
+            overlapped.hEvent = self.kernel32py.create_event()
+            started = True
+        finally:
+            if not started:
+                for handle in reversed(opened):
+                    if handle:
+                        self.kernel32py.close_handle(handle)
+
+        self._shell = {
+            "stdin": stdin_write,
+            "stdout": stdout_read,
+            "process": process_handle,
+            "overlapped": overlapped,
+            "buffer": ctypes.create_string_buffer(DEFAULT_READ_SIZE),
+            "token": f"__PY4WSL_END_{uuid.uuid4().hex}__".encode(),
+        }
+        # Only stdout is read back, discard the shell stderr
+        self.kernel32py.write_file(stdin_write, b"exec 2>/dev/null\n")
+        return self._shell
+
+    def exec(self, command, timeout=30000):
+        """
+        Run a command in the persistent shell.
+
+        The command runs in the same bash for the lifetime of the instance (state such as `cd`
+        persists) with stdin redirected from /dev/null; stderr is discarded.
+
+        Returns:
+            tuple: (stdout bytes, exit code). The exit code is -1 if the command timed out,
+            in which case the shell is closed and restarted on next use.
+        """
+        shell = self._get_shell()
+        token = shell["token"]
+        self.kernel32py.write_file(
+            shell["stdin"], f"{{ {command}\n}} </dev/null\nprintf '%s%d\\n' {token.decode()} $?\n".encode()
+        )
+
+        output = bytearray()
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            end = output.find(token)
+            if end != -1 and output.endswith(b"\n"):
+                return bytes(output[:end]), int(output[end + len(token):].strip())
+
+            if not self._start_read(shell["stdout"], shell["buffer"], shell["overlapped"]):
+                break
+            remaining = max(0, int((deadline - time.monotonic()) * 1000))
+            if self.kernel32py.wait_for_single_object(shell["overlapped"].hEvent, remaining) != WaitResult.OBJECT_0:
+                break
+            try:
+                n_bytes_transferred = self.kernel32py.get_overlapped_result(
+                    pipe_handle=shell["stdout"], overlapped=shell["overlapped"], wait=False
+                )
+            except OSError:
+                break
+            output += shell["buffer"][:n_bytes_transferred]
+            if n_bytes_transferred == len(shell["buffer"]):
+                output += self._drain(shell["stdout"], shell["overlapped"])
+
+        # Timed out or the shell died: drop it so the next call starts a fresh one
+        self.close()
+        return bytes(output), -1
+
+    def _launch_short(self, command):
+        """Run a short command through the persistent shell when enabled, else with _launch_process."""
+        if not self.persistent_shell:
+            return self._launch_process(command)
+        stdout, exit_code = self.exec(command)
+        return {"hr": 0, "stdout": stdout, "stderr": b"", "exit_code": exit_code}
+
+    def close(self):
+        """Terminate the persistent shell if it is running."""
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+        # Closing stdin makes bash exit; terminate it if it does not
+        self.kernel32py.close_handle(shell["stdin"])
+        if self.kernel32py.wait_for_single_object(shell["process"], 1000) != WaitResult.OBJECT_0:
+            self.kernel32py.terminate_process(process_handle=shell["process"])
+        # Any read still in flight must finish before its OVERLAPPED is released
+        self.kernel32py.cancel_io(shell["stdout"])
+        try:
+            self.kernel32py.get_overlapped_result(pipe_handle=shell["stdout"], overlapped=shell["overlapped"])
+        except OSError:
+            pass
+        for handle in (shell["stdout"], shell["process"], shell["overlapped"].hEvent):
+            self.kernel32py.close_handle(handle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     # ==============================================
     # Public methods
@@ -297,9 +774,14 @@ class WSL:
             "exit_code": result["exit_code"]
         }
 
-    def run_command(self, command, capture_output=True, shell=False, input=None):
-        """Execute a command using subprocess"""
+    def run_command(self, command, capture_output=True, shell=False, input=None, decode=True):
+        """
+        Execute a command using subprocess.
+        Output is captured as bytes and decoded once as UTF-8 (errors replaced) unless decode is False.
+        """
         base_cmd = ['wsl.exe', '-d', self.distro]
+        if isinstance(input, str):
+            input = input.encode("utf-8")
 
         try:
             if shell:
@@ -314,22 +796,21 @@ class WSL:
                 args,
                 input=input,
                 capture_output=capture_output,
-                text=True,
                 check=True,
                 shell=False
             )
 
             return {
-                "stdout": result.stdout,
-                "stderr": result.stderr,
+                "stdout": _decode_output(result.stdout, decode),
+                "stderr": _decode_output(result.stderr, decode),
                 "exit_code": result.returncode,
 
             }
 
         except subprocess.CalledProcessError as e:
             return {
-                "stdout": e.stdout,
-                "stderr": e.stderr,
+                "stdout": _decode_output(e.stdout, decode),
+                "stderr": _decode_output(e.stderr, decode),
                 "exit_code": e.returncode
             }
 
@@ -337,182 +818,210 @@ class WSL:
     # Administration
     # ========================
 
+    def _wsl_conf_unc_mtime(self):
+        """Returns the mtime of /etc/wsl.conf through \\wsl$, None if it does not exist, _UNKNOWN if \\wsl$ fails"""
+        try:
+            return os.stat(self._linux_to_unc("/etc/wsl.conf")).st_mtime_ns
+        except FileNotFoundError:
+            if os.path.isdir(self._linux_to_unc("/etc")):
+                return None
+        except OSError:
+            pass
+        return _UNKNOWN
+
     def parse_wsl_conf(self):
+        """
+        Analyzes /etc/wsl.conf and returns a WslConf.
+        Cached until the file changes; without \\wsl$ the mtime can not be checked, so the result is
+        then kept until refresh_conf() is called.
+        """
+        mtime = self._wsl_conf_unc_mtime()
+        if self._wslconf_cache is not None and (mtime is _UNKNOWN or mtime == self._wslconf_mtime):
+            return self._wslconf_cache
+
         raw_content = self.read_wsl_conf()
         if isinstance(raw_content, dict):
-            # Parsed. Just return.
-            return raw_content
+            raw_content = raw_content["stdout"].decode("utf-8", errors="replace")
 
-        config = {
-            'automount': {},
-            'network': {},
-            'interop': {},
-            'user': {},
-            'boot': {},
-            'useWindowsTimezone': {},
-            'systemd': {}
-        }
-        current_section = None
-        for line in raw_content.split('\n'):
-            line = line.strip()
-            if line.startswith('#') or not line:
-                continue
-            if line.startswith('[') and line.endswith(']'):
-                current_section = line[1:-1].lower()
-                continue
-            if '=' in line and current_section:
-                key, value = line.split('=', 1)
-                key = key.strip().lower()
-                value = value.strip()
-                if value.lower() in ('true', 'false'):
-                    value = value.lower() == 'true'
-                if current_section in config:
-                    config[current_section][key] = value
+        config = WslConf(**_parse_ini(raw_content, WSL_CONF_SECTIONS))
+
+        self._wslconf_cache = config
+        self._wslconf_mtime = mtime
         return config
 
+    def refresh_conf(self):
+        """Drops the cached wsl.conf and .wslconfig so they are read and parsed again on next use"""
+        self._wslconf_cache = None
+        self._wslconf_mtime = None
+        self._wslconfig_cache = None
+        self._wslconfig_mtime = None
+        self._wslconfig_bytes = None
+
     def install_package(self, package, password):
         """Install a package using sudo"""
-        return self.run_command(
-            f"sudo -S apt-get install -y {package}",
-            input=f"{password}\n",
-            shell=False
+        result = self._launch_process(
+            f"sudo -S apt-get install -y {shlex.quote(package)}",
+            stdin_bytes=f"{password}\n".encode("utf-8"),
+            timeout=INFINITE
         )
+        return {
+            "stdout": result["stdout"].decode("utf-8", errors="replace"),
+            "stderr": result["stderr"].decode("utf-8", errors="replace"),
+            "exit_code": result["exit_code"]
+        }
 
+    # Single-option accessors, all served from the shared parse cache
     def is_interop_enabled(self):
         """Returns True if interoperatibility is enabled"""
-        conf = self.parse_wsl_conf()
-        return conf.get('interop', {}).get('enabled', True)
+        return self.parse_wsl_conf().interop.get('enabled', True)
 
     def is_systemd_enabled(self):
         """Returns True if systemd is enabled"""
-        conf = self.parse_wsl_conf()
-        return conf.get('systemd', {}).get('enabled', True)
+        return self.parse_wsl_conf().systemd.get('enabled', True)
 
     def is_useWindowsTimezone_enabled(self):
         """Returns True if useWindowsTimezone is enabled"""
-        conf = self.parse_wsl_conf()
-        return conf.get('useWindowsTimezone', {}).get('enabled', True)
+        return self.parse_wsl_conf().useWindowsTimezone.get('enabled', True)
+
+    def get_default_user(self):
+        """Returns default user"""
+        return self.parse_wsl_conf().user.get('default')
 
     def get_network_config(self):
         """Returns network configuration in dict format"""
-        conf = self.parse_wsl_conf()
+        network = self.parse_wsl_conf().network
         return {
-            'hostname': conf.get('network', {}).get('hostname'),
-            'generate_hosts': conf.get('network', {}).get('generatehosts', True),
-            'generate_resolvconf': conf.get('network', {}).get('generateresolvconf', True)
+            'hostname': network.get('hostname'),
+            'generate_hosts': network.get('generatehosts', True),
+            'generate_resolvconf': network.get('generateresolvconf', True)
         }
 
     def get_automount_settings(self):
         """Returns mount config"""
-        conf = self.parse_wsl_conf()
+        automount = self.parse_wsl_conf().automount
         return {
-            'enabled': conf.get('automount', {}).get('enabled', True),
-            'root': conf.get('automount', {}).get('root', '/mnt'),
-            'options': conf.get('automount', {}).get('options', '')
+            'enabled': automount.get('enabled', True),
+            'root': automount.get('root', '/mnt'),
+            'options': automount.get('options', '')
         }
 
-    def get_default_user(self):
-        """Returns default user"""
-        return self.parse_wsl_conf().get('user', {}).get('default')
-
     def read_wsl_conf(self, output_format='raw'):
-        """Reads /etc/wsl.conf"""
-        return self._launch_process("cat /etc/wsl.conf")
+        """
+        Reads /etc/wsl.conf through \\\\wsl$, falling back to cat inside the distro only when the share
+        is not reachable. A missing file on a reachable share gives empty output and exit code 1.
+        """
+        try:
+            with open(self._linux_to_unc("/etc/wsl.conf"), "rb") as f:
+                return {"hr": 0, "stdout": f.read(), "stderr": b"", "exit_code": 0}
+        except FileNotFoundError:
+            if os.path.isdir(self._linux_to_unc("/etc")):
+                return {"hr": 0, "stdout": b"", "stderr": b"", "exit_code": 1}
+        except OSError:
+            pass
+        return self._launch_short("cat /etc/wsl.conf")
+
+    def _detect_pkg_manager(self):
+        """
+        (name, list command) of the first package manager found in the distro, or None.
+        A manager once found is kept for the rest of the session; a probe that finds none (or fails
+        to launch) is retried on the next call.
+        """
+        if self._pkg_manager is not None:
+            return self._pkg_manager
+
+        commands = {
+            "apt": "apt list",
+            "dnf": "dnf list installed",
+            "yum": "yum list installed",
+            "zypper": "zypper se --installed-only",
+        }
+        # Detect the first available package manager with a single launch
+        managers = " ".join(commands)
+        probe = f'for m in {managers}; do command -v "$m" >/dev/null && {{ echo "$m"; break; }}; done'
+        name = self._launch_short(probe)["stdout"].decode("utf-8", errors="replace").strip()
+        if name not in commands:
+            return None
+        self._pkg_manager = (name, commands[name])
+        return self._pkg_manager
 
     def list_installed_packages(self):
         """List installed packages"""
-        commands = [
-            ("apt", "apt list"),
-            ("dnf", "dnf list installed"),
-            ("yum", "yum list installed"),
-            ("zypper", "zypper se --installed-only"),
-        ]
-        for name, cmd in commands:
-            # Check package manager available
-            check = self.run_command(f"which {name}")
-            if isinstance(check, dict):
-                found = bool(check.get('stdout', '').strip())
-            else:
-                found = bool(check.strip())
-            if not found:
-                continue
-
-                # Execute command to list packages
-            result = self.run_command(cmd)
-            output = result.get('stdout', '') if isinstance(result, dict) else result
-            if output:
-                return output.splitlines()
+        manager = self._detect_pkg_manager()
+        if manager is None:
+            # Empty list if no manager available
+            return []
 
-        # Empty list if no manager available
-        return []
+        # Execute command to list packages
+        result = self.run_command(manager[1], decode=False)
+        output = result.get('stdout') or b""
+        return [line.decode("utf-8", errors="replace") for line in output.splitlines()]
 
     # ========================
     # Windows configuration
     # ========================
+    def _load_wslconfig(self):
+        """
+        Returns the raw bytes of .wslconfig, read (through mmap) only when its mtime changed.
+        Raises OSError if the file can not be read.
+        """
+        path = os.path.expanduser("~/.wslconfig")
+        st = os.stat(path)
+        if self._wslconfig_bytes is None or st.st_mtime_ns != self._wslconfig_mtime:
+            with open(path, "rb") as f:
+                if st.st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = bytes(mm)
+                else:
+                    # Empty files can not be mapped
+                    data = b""
+            self._wslconfig_bytes = data
+            self._wslconfig_mtime = st.st_mtime_ns
+            self._wslconfig_cache = None
+        return self._wslconfig_bytes
+
     def read_wslconfig(self):
         """Read .wslconfig"""
         path = os.path.expanduser("~/.wslconfig")
 
         try:
-            with open(path, "r") as f:
-                return f.read()
+            return self._load_wslconfig().decode("utf-8-sig", errors="replace")
         except Exception as e:
             print(f"Error leyendo {path}: {e}")
             return None
 
     def parse_wslconfig(self):
-        """Analyzes .wslconfig and return dictionary"""
-        raw_content = self.read_wslconfig()
-        config = {
-            'wsl2': {}
-        }
-        current_section = None
-        if raw_content is not None:
-            for line in raw_content.split('\n'):
-                line = line.strip()
-                if line.startswith('#') or not line:
-                    continue
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1].lower()
-                    continue
-                if '=' in line and current_section:
-                    key, value = line.split('=', 1)
-                    key = key.strip().lower()
-                    value = value.strip()
-                    # Boolean converter
-                    if value.lower() in ('true', 'false'):
-                        value = value.lower() == 'true'
-                    # Convert numbers
-                    elif value.isdigit():
-                        value = int(value)
-                    if current_section in config:
-                        config[current_section][key] = value
-        return config
+        """Analyzes .wslconfig and return dictionary. Cached until the file changes"""
+        try:
+            raw_content = self._load_wslconfig()
+        except OSError:
+            # No .wslconfig: every option takes its default
+            return _parse_ini("", WSLCONFIG_SECTIONS)
+
+        if self._wslconfig_cache is None:
+            self._wslconfig_cache = _parse_ini(
+                raw_content.decode("utf-8-sig", errors="replace"), WSLCONFIG_SECTIONS
+            )
+        return self._wslconfig_cache
 
     def wsl2_memory(self):
         """Returns memory limit in WSL2 or None"""
-        conf = self.parse_wslconfig()
-        return conf.get('wsl2', {}).get('memory')
+        return self.parse_wslconfig()['wsl2'].get('memory')
 
     def wsl2_processors(self):
         """Returns processors in WSL2 or None"""
-        conf = self.parse_wslconfig()
-        return conf.get('wsl2', {}).get('processors')
+        return self.parse_wslconfig()['wsl2'].get('processors')
 
     def wsl2_swap(self):
         """Returns swap size in WSL2 or None"""
-        conf = self.parse_wslconfig()
-        return conf.get('wsl2', {}).get('swap')
+        return self.parse_wslconfig()['wsl2'].get('swap')
 
     def wsl2_localhost_forwarding(self):
         """Returns True/False for localhostForwarding in WSL2"""
-        conf = self.parse_wslconfig()
-        return conf.get('wsl2', {}).get('localhostforwarding', True)
+        return self.parse_wslconfig()['wsl2'].get('localhostforwarding', True)
 
     def wsl2_gui_applications(self):
         """Devuelve True/False según la opción guiApplications de WSL2"""
-        conf = self.parse_wslconfig()
-        return conf.get('wsl2', {}).get('guiapplications', True)
+        return self.parse_wslconfig()['wsl2'].get('guiapplications', True)
 
         # ========================
 
@@ -541,16 +1050,65 @@ done
         with open(script_path, "w", encoding="utf-8", newline='\n') as f:
             f.write(nuevo_fichero)
 
-        wsl_user = str(self.launch('whoami')["stdout"]).strip()
-
-        wsl_dest = f"/home/{wsl_user}/nosleep.sh"
+        wsl_dest = f"/home/{self.wsl_user}/nosleep.sh"
         self.copy_to_wsl(f"nosleep.sh", wsl_dest)
-        self.launch(f"chmod +x '{wsl_dest}'")
+        self._launch_short(f"chmod +x '{wsl_dest}'")
         self.launch(f"tmux new-session -d '{wsl_dest}'")
 
     # ========================
     # File functions
     # ========================
+    def _linux_to_unc(self, path, distro=None):
+        """Converts an absolute Linux path to its \\\\wsl$\\<distro> UNC path without launching WSL"""
+        return f"\\\\wsl$\\{distro or self.distro}{path.replace('/', chr(92))}"
+
+    def _to_windows_path(self, path, distro=None):
+        """
+        Converts a Linux path to a Windows path.
+        Absolute paths are translated directly; relative ones go through wslpath inside the distro.
+        """
+        return self._to_windows_paths([path], distro)[0]
+
+    def _to_windows_paths(self, paths, distro=None):
+        """
+        Converts several Linux paths to Windows paths.
+        Absolute paths are translated directly. Relative ones depend on the current directory and are
+        cached per (distro, cwd, path); the ones not cached yet are resolved with a single wslpath launch.
+        """
+        distro = distro or self.distro
+        cwd = os.getcwd()
+        converted = {}
+        # Insertion-ordered set of the relative paths still to resolve
+        missing = {}
+        for path in paths:
+            if path.startswith('/'):
+                converted[path] = self._linux_to_unc(path, distro)
+            elif (distro, cwd, path) in self._wslpath_cache:
+                converted[path] = self._wslpath_cache[(distro, cwd, path)]
+            elif path not in missing:
+                missing[path] = None
+
+        if missing:
+            try:
+                result = subprocess.run(
+                    ["wsl", "-d", distro, "sh", "-c", 'for p; do wslpath -w "$p" || exit; done', "sh", *missing],
+                    capture_output=True,
+                    check=True
+                )
+                paths_win = _decode_output(result.stdout).splitlines()
+                if len(paths_win) != len(missing) or not all(paths_win):
+                    raise RuntimeError("Path convertion with no result.")
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Error executing wslpath: {_decode_output(e.stderr).strip()}") from e
+            except Exception as e:
+                raise RuntimeError(f"Unexpected error converting path: {e}") from e
+            for path, path_win in zip(missing, paths_win):
+                path_win = path_win.strip()
+                self._wslpath_cache[(distro, cwd, path)] = path_win
+                converted[path] = path_win
+
+        return [converted[path] for path in paths]
+
     def copy_to_wsl(self, origin, dest, distro="Ubuntu"):
         """
         Copies a Windows file (origin) to a destination path (dest) in the specified WSL distribution.
@@ -559,22 +1117,8 @@ done
         - distro: Name of the WSL distribution (default 'Ubuntu')
 
         """
-        # wslpath to convert linux destination path
         print(dest)
-        try:
-            result = subprocess.run(
-                ["wsl", "-d", distro, "wslpath", "-w", dest],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            dest_win = result.stdout.strip()
-            if not dest:
-                raise RuntimeError("Path convertion with no result.")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Error executing wslpath: {e.stderr.strip()}") from e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error converting path: {e}") from e
+        dest_win = self._to_windows_path(dest, distro)
 
         # Copy the file
         try:
@@ -584,6 +1128,23 @@ done
         except Exception as e:
             raise RuntimeError(f"Error copying file: {e}") from e
 
+    def copy_many_to_wsl(self, pairs, distro="Ubuntu"):
+        """
+        Copies several Windows files to the specified WSL distribution.
+        - pairs: Iterable of (origin, dest) tuples, as in copy_to_wsl
+        - distro: Name of the WSL distribution (default 'Ubuntu')
+        All the destinations are converted before copying, with at most one wslpath launch.
+        """
+        pairs = list(pairs)
+        dests_win = self._to_windows_paths([dest for _, dest in pairs], distro)
+
+        try:
+            for (origin, _), dest_win in zip(pairs, dests_win):
+                shutil.copy2(origin, dest_win)
+            return True
+        except Exception as e:
+            raise RuntimeError(f"Error copying file: {e}") from e
+
     def copy_from_wsl(self, origin, dest, distro="Ubuntu"):
         """
         Copies a file from a path in WSL (origin, Linux) to a destination path in Windows (dest).
@@ -592,21 +1153,7 @@ done
         - distro: Name of the WSL distribution (default 'Ubuntu')
         
         """
-        # wslpath converting origin linux path to windows
-        try:
-            result = subprocess.run(
-                ["wsl", "-d", distro, "wslpath", "-w", origin],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            origin_win = result.stdout.strip()
-            if not origin_win:
-                raise RuntimeError("Path convertion with no result.")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Error executing wslpath: {e.stderr.strip()}") from e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error converting path: {e}") from e
+        origin_win = self._to_windows_path(origin, distro)
 
         # Check if file exists in windows path
         if not os.path.isfile(origin_win):
@@ -620,13 +1167,20 @@ done
             raise RuntimeError(f"Error copying file: {e}") from e
 
     def wsl_backup(self, dest, distro="Ubuntu"):
-        cmd = f"wsl --export {distro} {dest})"
+        """
+        Exports the distribution to dest in the background.
+        A .vhdx destination is exported as a disk image (--vhd), a block copy instead of a tar stream.
+        Returns the Popen object. Progress output is discarded so wait()/poll() can not block on a full
+        pipe; only stderr is piped, to read wsl.exe's error message with communicate() if it fails.
+        """
+        cmd = ["wsl.exe", "--export", distro, dest]
+        if os.path.splitext(dest)[1].lower() == ".vhdx":
+            cmd.append("--vhd")
 
         process = subprocess.Popen(
             cmd,
-            shell=True,
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+            stderr=subprocess.PIPE
         )
         return process
 
@@ -634,15 +1188,51 @@ done
     # Network funtions
     # ========================
 
-    def get_wsl_ip(self):
+    def get_wsl_ip(self, refresh=False):
         """
-        Gets current IP.
-        If distro_name is None, uses defautl.
+        Gets current IP, or None if the distro reports none.
+        Runs `hostname -I` through WslLaunch (or the persistent shell) instead of spawning wsl.exe.
+        The IP is reused for WSL_IP_TTL seconds since it may change when the VM restarts; pass
+        refresh=True or call refresh_ip() to query it again right away.
         """
-        if self.distro:
-            cmd = f"wsl -d {self.distro} hostname -I"
-        else:
-            cmd = "wsl hostname -I"
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
-        ip = result.stdout.strip().split()[0]
+        if not refresh and self._wsl_ip is not None and time.monotonic() - self._wsl_ip_time <= WSL_IP_TTL:
+            return self._wsl_ip
+
+        output = self._launch_short("hostname -I")["stdout"].decode("utf-8", errors="replace").split()
+        if not output:
+            return None
+        ip = output[0]
+        self._wsl_ip = ip
+        self._wsl_ip_time = time.monotonic()
         return ip
+
+    def refresh_ip(self):
+        """Drops the cached IP, e.g. after a network change, and returns the newly queried one"""
+        self._wsl_ip = None
+        return self.get_wsl_ip(refresh=True)
+
+    @property
+    def wsl_ip(self):
+        """Current IP, same as get_wsl_ip()"""
+        return self.get_wsl_ip()
+
+    def _query_value(self, command):
+        """
+        Runs a one-word query such as whoami and returns its output.
+        Raises RuntimeError if the command fails or prints nothing, so the caller caches nothing.
+        """
+        result = self._launch_short(command)
+        value = result["stdout"].decode("utf-8", errors="replace").strip()
+        if result["exit_code"] != 0 or not value:
+            raise RuntimeError(f"Error executing {command}: exit code {result['exit_code']}")
+        return value
+
+    @cached_property
+    def wsl_hostname(self):
+        """Hostname of the distro, queried once per instance (retried on the next access if it fails)"""
+        return self._query_value("hostname")
+
+    @cached_property
+    def wsl_user(self):
+        """User the distro runs commands as, queried once per instance (retried on the next access if it fails)"""
+        return self._query_value("whoami")
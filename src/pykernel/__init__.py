@@ -1 +1 @@
-# This package contains modules for interacting with the Windows API (kernel32, ole32, wslapi)
+# This package contains modules for interacting with the Windows API (advapi32, kernel32, ole32, wslapi)
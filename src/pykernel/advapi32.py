@@ -0,0 +1,311 @@
+"""
+advapi32.py
+
+This module provides a Python wrapper for selected registry functions from the Windows ADVAPI32 library using ctypes.
+It supports opening, enumerating and querying keys into caller-provided buffers, and registry change notifications
+via RegNotifyChangeKeyValue.
+"""
+import ctypes
+import functools
+from ctypes import wintypes
+
+from enum import IntEnum, IntFlag
+from typing import Any, Dict, Sequence, Tuple
+
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+ERROR_MORE_DATA = 234
+ERROR_NO_MORE_ITEMS = 259
+
+KEY_READ = 0x20019
+KEY_WOW64_64KEY = 0x0100
+
+
+class RegType(IntEnum):
+    """
+    Registry value types.
+    """
+    NONE = 0
+    SZ = 1
+    EXPAND_SZ = 2
+    BINARY = 3
+    DWORD = 4
+    MULTI_SZ = 7
+    QWORD = 11
+
+
+class RegNotifyFilter(IntFlag):
+    """
+    Flags selecting which registry changes are reported by RegNotifyChangeKeyValue.
+    """
+    NAME = 0x00000001
+    ATTRIBUTES = 0x00000002
+    LAST_SET = 0x00000004
+    SECURITY = 0x00000008
+    THREAD_AGNOSTIC = 0x10000000
+
+
+class ValentW(ctypes.Structure):
+    """
+    Structure for VALENTW, one entry of a RegQueryMultipleValuesW request.
+    """
+    _fields_ = [
+        ("ve_valuename", wintypes.LPWSTR),
+        ("ve_valuelen", wintypes.DWORD),
+        ("ve_valueptr", ctypes.c_size_t),
+        ("ve_type", wintypes.DWORD)
+    ]
+
+
+class Advapi32:
+    """
+    Wrapper class for selected ADVAPI32 registry functions using ctypes.
+    """
+
+    def __init__(self):
+        """
+        Initialize the Advapi32 wrapper and configure function signatures.
+        """
+        self.__advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+        self.__configure_advapi32_functions()
+
+    def __configure_advapi32_functions(self):
+        """
+        Configure argument and return types for the used ADVAPI32 functions.
+        """
+        self.__advapi32.RegNotifyChangeKeyValue.argtypes = [
+            wintypes.HKEY,
+            wintypes.BOOL,
+            wintypes.DWORD,
+            wintypes.HANDLE,
+            wintypes.BOOL
+        ]
+        self.__advapi32.RegNotifyChangeKeyValue.restype = wintypes.LONG
+
+        self.__advapi32.RegOpenKeyExW.argtypes = [
+            wintypes.HKEY,
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.HKEY)
+        ]
+        self.__advapi32.RegOpenKeyExW.restype = wintypes.LONG
+
+        self.__advapi32.RegCloseKey.argtypes = [wintypes.HKEY]
+        self.__advapi32.RegCloseKey.restype = wintypes.LONG
+
+        self.__advapi32.RegEnumKeyExW.argtypes = [
+            wintypes.HKEY,
+            wintypes.DWORD,
+            wintypes.LPWSTR,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.DWORD),
+            wintypes.LPWSTR,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.FILETIME)
+        ]
+        self.__advapi32.RegEnumKeyExW.restype = wintypes.LONG
+
+        self.__advapi32.RegQueryValueExW.argtypes = [
+            wintypes.HKEY,
+            wintypes.LPCWSTR,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.c_void_p,
+            ctypes.POINTER(wintypes.DWORD)
+        ]
+        self.__advapi32.RegQueryValueExW.restype = wintypes.LONG
+
+        self.__advapi32.RegQueryMultipleValuesW.argtypes = [
+            wintypes.HKEY,
+            ctypes.POINTER(ValentW),
+            wintypes.DWORD,
+            ctypes.c_void_p,
+            ctypes.POINTER(wintypes.DWORD)
+        ]
+        self.__advapi32.RegQueryMultipleValuesW.restype = wintypes.LONG
+
+        # Bind the configured functions once so the wrappers skip the DLL attribute lookup
+        self._RegNotifyChangeKeyValue = self.__advapi32.RegNotifyChangeKeyValue
+        self._RegOpenKeyExW = self.__advapi32.RegOpenKeyExW
+        self._RegCloseKey = self.__advapi32.RegCloseKey
+        self._RegEnumKeyExW = self.__advapi32.RegEnumKeyExW
+        self._RegQueryValueExW = self.__advapi32.RegQueryValueExW
+        self._RegQueryMultipleValuesW = self.__advapi32.RegQueryMultipleValuesW
+
+    def reg_open_key_ex(self, key, sub_key: str, access: int = KEY_READ) -> wintypes.HKEY:
+        """
+        Open a registry subkey.
+
+        Args:
+            key: Parent key handle (an int, a wintypes.HKEY or a winreg.HKEYType).
+            sub_key (str): Name of the subkey (may be a buffer from reg_enum_key_ex).
+            access (int): Requested access rights (default: KEY_READ).
+        Returns:
+            wintypes.HKEY: Handle to the opened key; release it with reg_close_key.
+        Raises:
+            WindowsError: If the key can not be opened.
+        """
+        opened = wintypes.HKEY()
+        error = self._RegOpenKeyExW(_hkey(key), sub_key, 0, access, opened)
+        if error != ERROR_SUCCESS:
+            raise ctypes.WinError(error)
+        return opened
+
+    def reg_close_key(self, key) -> int:
+        """
+        Close a registry key handle.
+
+        Args:
+            key: Key handle returned by reg_open_key_ex.
+        Returns:
+            int: ERROR_SUCCESS (0) or a Win32 error code.
+        """
+        return self._RegCloseKey(_hkey(key))
+
+    def reg_enum_key_ex(self, key, index: int, name_buffer) -> int:
+        """
+        Retrieve the name of the subkey at the given index into a reusable buffer.
+
+        Args:
+            key: Key handle whose subkeys are enumerated.
+            index (int): Zero-based subkey index.
+            name_buffer: Unicode buffer (ctypes.create_unicode_buffer) receiving the name.
+        Returns:
+            int: ERROR_SUCCESS, ERROR_NO_MORE_ITEMS or another Win32 error code.
+        """
+        name_size = wintypes.DWORD(len(name_buffer))
+        return self._RegEnumKeyExW(
+            _hkey(key), index, name_buffer, name_size, None, None, None, None
+        )
+
+    def reg_query_value_ex(self, key, value_name: str, data_buffer) -> Tuple[int, int, int]:
+        """
+        Read the raw data of a registry value into a reusable buffer.
+
+        Args:
+            key: Key handle containing the value.
+            value_name (str): Name of the value.
+            data_buffer: Buffer (ctypes.create_string_buffer) receiving the data.
+        Returns:
+            Tuple[int, int, int]: (error code, value type, data size in bytes). On ERROR_MORE_DATA the size is
+            the one required.
+        """
+        value_type = wintypes.DWORD()
+        data_size = wintypes.DWORD(ctypes.sizeof(data_buffer))
+        error = self._RegQueryValueExW(
+            _hkey(key), value_name, None, value_type, data_buffer, data_size
+        )
+        return error, value_type.value, data_size.value
+
+    def reg_query_value(self, key, value_name: str, data_buffer=None) -> Any:
+        """
+        Read a registry value and convert it to a Python object, like winreg.QueryValueEx()[0].
+
+        REG_SZ/REG_EXPAND_SZ are returned as str, REG_DWORD/REG_QWORD as int, other types as bytes.
+
+        Args:
+            key: Key handle containing the value.
+            value_name (str): Name of the value.
+            data_buffer: Optional reusable buffer; a larger one is allocated if it is too small.
+        Returns:
+            Any: The converted value.
+        Raises:
+            FileNotFoundError: If the value does not exist.
+            WindowsError: If the value can not be read.
+        """
+        if data_buffer is None:
+            data_buffer = ctypes.create_string_buffer(1024)
+        error, value_type, data_size = self.reg_query_value_ex(key, value_name, data_buffer)
+        if error == ERROR_MORE_DATA:
+            data_buffer = ctypes.create_string_buffer(data_size)
+            error, value_type, data_size = self.reg_query_value_ex(key, value_name, data_buffer)
+        if error != ERROR_SUCCESS:
+            raise ctypes.WinError(error)
+        return _convert_value(value_type, ctypes.addressof(data_buffer), data_size)
+
+    def reg_query_multiple_values(self, key, value_names: Sequence[str], data_buffer=None) -> Dict[str, Any]:
+        """
+        Read several values of a key with a single RegQueryMultipleValuesW call.
+
+        Values are converted like reg_query_value. The call fails as a whole if any of the values is
+        missing.
+
+        Args:
+            key: Key handle containing the values.
+            value_names (Sequence[str]): Names of the values.
+            data_buffer: Optional reusable buffer; a larger one is allocated if it is too small.
+        Returns:
+            Dict[str, Any]: The converted values by name.
+        Raises:
+            FileNotFoundError: If one of the values does not exist.
+            WindowsError: If the values can not be read.
+        """
+        if data_buffer is None:
+            data_buffer = ctypes.create_string_buffer(1024)
+        entries = (ValentW * len(value_names))()
+        for entry, name in zip(entries, value_names):
+            entry.ve_valuename = name
+
+        data_size = wintypes.DWORD(ctypes.sizeof(data_buffer))
+        error = self._RegQueryMultipleValuesW(_hkey(key), entries, len(value_names), data_buffer, data_size)
+        if error == ERROR_MORE_DATA:
+            data_buffer = ctypes.create_string_buffer(data_size.value)
+            error = self._RegQueryMultipleValuesW(_hkey(key), entries, len(value_names), data_buffer, data_size)
+        if error != ERROR_SUCCESS:
+            raise ctypes.WinError(error)
+
+        # ve_valueptr points into data_buffer, which is alive until the conversion is done
+        return {
+            name: _convert_value(entry.ve_type, entry.ve_valueptr, entry.ve_valuelen)
+            for name, entry in zip(value_names, entries)
+        }
+
+    def reg_notify_change_key_value(self, key, event: wintypes.HANDLE, watch_subtree: bool = True,
+                                    notify_filter: RegNotifyFilter = RegNotifyFilter.NAME | RegNotifyFilter.LAST_SET,
+                                    asynchronous: bool = True) -> int:
+        """
+        Request a notification when the registry key (or its subtree) changes.
+
+        The registration fires once: the event is signaled on the next change and a new call is needed
+        to keep watching.
+
+        Args:
+            key: Registry key handle, opened with KEY_NOTIFY (an int or a winreg.HKEYType).
+            event (wintypes.HANDLE): Event signaled when a change occurs.
+            watch_subtree (bool): Also report changes on subkeys (default: True).
+            notify_filter (RegNotifyFilter): Changes to report (default: NAME | LAST_SET).
+            asynchronous (bool): Return immediately and signal the event later (default: True).
+        Returns:
+            int: ERROR_SUCCESS (0) or a Win32 error code.
+        """
+        return self._RegNotifyChangeKeyValue(
+            _hkey(key), watch_subtree, notify_filter, event, asynchronous
+        )
+
+
+def _convert_value(value_type: int, address: int, size: int) -> Any:
+    """Convert raw registry data at the given address like winreg does for the supported types."""
+    if value_type in (RegType.SZ, RegType.EXPAND_SZ):
+        return ctypes.wstring_at(address, size // 2).rstrip("\0")
+    if value_type == RegType.DWORD:
+        return ctypes.c_uint32.from_address(address).value
+    if value_type == RegType.QWORD:
+        return ctypes.c_uint64.from_address(address).value
+    return ctypes.string_at(address, size)
+
+
+def _hkey(key) -> int:
+    """Return the raw handle value of an int, wintypes.HKEY or winreg.HKEYType key."""
+    return key.value if isinstance(key, wintypes.HKEY) else int(key)
+
+
+@functools.lru_cache(maxsize=None)
+def get_advapi32() -> Advapi32:
+    """
+    Return the process-wide Advapi32 wrapper, configuring its functions on first use.
+
+    Returns:
+        Advapi32: Shared wrapper instance.
+    """
+    return Advapi32()
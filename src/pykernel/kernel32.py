@@ -5,10 +5,51 @@ This module provides a Pythonic interface to selected Windows Kernel32 API funct
 It defines structures and wrapper methods for pipe creation, file reading, process management, and synchronization primitives.
 """
 import ctypes
+import functools
+import itertools
+import os
+import threading
+from collections import deque
 from ctypes import wintypes
 
 from enum import IntEnum
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional, Sequence
+
+# Constants for the overlapped pipes created by Kernel32.create_overlapped_pipe
+PIPE_ACCESS_INBOUND = 0x00000001
+FILE_FLAG_FIRST_PIPE_INSTANCE = 0x00080000
+FILE_FLAG_OVERLAPPED = 0x40000000
+GENERIC_WRITE = 0x40000000
+OPEN_EXISTING = 3
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+HANDLE_FLAG_INHERIT = 0x00000001
+INFINITE = 0xFFFFFFFF
+
+# Pipe buffer and read size; 64 KiB is where pipe throughput levels off on Windows
+DEFAULT_READ_SIZE = 65536
+
+# Flag for RegisterWaitForSingleObject: the callback runs once and the wait is then deactivated
+WT_EXECUTEONLYONCE = 0x00000008
+
+_pipe_counter = itertools.count()
+
+# VOID CALLBACK WaitOrTimerCallback(PVOID lpParameter, BOOLEAN TimerOrWaitFired)
+WAITORTIMERCALLBACK = ctypes.WINFUNCTYPE(None, ctypes.c_void_p, wintypes.BOOLEAN)
+
+# Python callbacks of the registered waits by id; the id is passed to the thread pool as lpParameter
+_wait_callbacks = {}
+_wait_ids = itertools.count(1)
+
+
+def _on_wait(context, timed_out):
+    callback = _wait_callbacks.pop(context, None)
+    if callback is not None:
+        callback(bool(timed_out))
+
+
+# A single C callback that lives as long as the module, so it can never be freed while a
+# thread-pool thread is still running it
+_wait_callback = WAITORTIMERCALLBACK(_on_wait)
 
 
 class WaitResult(IntEnum):
@@ -20,6 +61,41 @@ class WaitResult(IntEnum):
     FAILED = 0xFFFFFFFF
 
 
+class ErrorCode(IntEnum):
+    """
+    Enum for the Win32 error codes handled when reading from pipes.
+    """
+    HANDLE_EOF = 38
+    BROKEN_PIPE = 109
+    WAIT_TIMEOUT = 258
+    OPERATION_ABORTED = 995
+    IO_PENDING = 997
+
+
+class Kernel32Error(OSError):
+    """
+    OSError raised by the Kernel32 wrapper for a failed call.
+
+    Unlike ctypes.WinError, the system message is only formatted (FormatMessageW) when the error is
+    printed or its strerror is read, so errors that callers expect and handle by code, such as
+    ERROR_BROKEN_PIPE at the end of a pipe, stay cheap.
+    """
+
+    def __init__(self, winerror: int):
+        """
+        Args:
+            winerror (int): Win32 error code, usually from ctypes.get_last_error().
+        """
+        super().__init__(None, None, None, winerror)
+
+    @property
+    def strerror(self) -> str:
+        return ctypes.FormatError(self.winerror)
+
+    def __str__(self) -> str:
+        return f"[WinError {self.winerror}] {self.strerror}"
+
+
 class SecurityAttributes(ctypes.Structure):
     """
     Structure for SECURITY_ATTRIBUTES used in Windows API calls.
@@ -44,6 +120,122 @@ class Overlapped(ctypes.Structure):
     ]
 
 
+# Structure sizes, computed once instead of through ctypes.sizeof on every call
+SecurityAttributes._SIZE = ctypes.sizeof(SecurityAttributes)
+Overlapped._SIZE = ctypes.sizeof(Overlapped)
+
+
+class BufferPool:
+    """
+    Pool of reusable (read buffer, OVERLAPPED) pairs for overlapped reads.
+
+    A pair must stay rented for as long as a read using it may be in flight, so callers release it
+    only after the read completed or was cancelled and drained.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_READ_SIZE, max_size: int = 256):
+        """
+        Initialize an empty pool.
+
+        Args:
+            buffer_size (int): Size in bytes of the buffers handed out (default: DEFAULT_READ_SIZE).
+            max_size (int): Maximum number of idle pairs kept for reuse (default: 256).
+        """
+        self.buffer_size = buffer_size
+        self.max_size = max_size
+        self.__free = deque()
+
+    def acquire(self) -> Tuple[ctypes.Array, Overlapped]:
+        """
+        Rent a buffer and a zeroed OVERLAPPED structure, allocating them if the pool is empty.
+
+        Returns:
+            Tuple[ctypes.Array, Overlapped]: (buffer, overlapped)
+        """
+        try:
+            buffer, overlapped = self.__free.pop()
+        except IndexError:
+            return ctypes.create_string_buffer(self.buffer_size), Overlapped()
+        ctypes.memset(ctypes.addressof(overlapped), 0, Overlapped._SIZE)
+        return buffer, overlapped
+
+    def release(self, buffer: ctypes.Array, overlapped: Overlapped) -> None:
+        """
+        Return a pair to the pool; it is dropped if the pool is already full.
+
+        Args:
+            buffer (ctypes.Array): Buffer obtained from acquire.
+            overlapped (Overlapped): OVERLAPPED structure obtained from acquire.
+        """
+        if len(self.__free) < self.max_size:
+            self.__free.append((buffer, overlapped))
+
+    def __len__(self) -> int:
+        return len(self.__free)
+
+
+class CompletionPort:
+    """
+    I/O completion port collecting the completions of overlapped operations on several handles.
+
+    Every attached handle reports its completions with its own key, so a single poll loop can service
+    all of them. Close the port with close() (or use it as a context manager) once every operation
+    issued on the attached handles has been dequeued.
+    """
+
+    def __init__(self, kernel32: Optional["Kernel32"] = None):
+        """
+        Create the port.
+
+        Args:
+            kernel32 (Optional[Kernel32]): Wrapper used for the calls (default: the shared get_kernel32()).
+        Raises:
+            Kernel32Error: If the port can not be created.
+        """
+        self.__kernel32 = kernel32 or get_kernel32()
+        self.handle = self.__kernel32.create_io_completion_port()
+
+    def attach(self, handle: wintypes.HANDLE, key: int) -> None:
+        """
+        Associate a handle opened for overlapped I/O with the port.
+
+        Args:
+            handle (wintypes.HANDLE): Handle to a file or pipe.
+            key (int): Completion key reported with the completions of the handle.
+        Raises:
+            Kernel32Error: If the handle can not be associated.
+        """
+        self.__kernel32.create_io_completion_port(handle, self.handle, key)
+
+    def poll(self, timeout=INFINITE) -> Tuple[int, int, Optional[int], int]:
+        """
+        Wait for the next completion.
+
+        Args:
+            timeout (int): Time-out interval in milliseconds (default: INFINITE).
+        Returns:
+            Tuple[int, int, Optional[int], int]: (bytes transferred, completion key, address of the
+            OVERLAPPED structure, error code). The address is None if nothing was dequeued, in which case
+            the error code is ErrorCode.WAIT_TIMEOUT on time-out.
+        """
+        error, bytes_transferred, key, overlapped = self.__kernel32.get_queued_completion_status(self.handle, timeout)
+        return bytes_transferred, key, overlapped, error
+
+    def close(self) -> None:
+        """
+        Close the port handle.
+        """
+        if self.handle:
+            self.__kernel32.close_handle(self.handle)
+            self.handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class Kernel32:
     """
     Wrapper class for selected Kernel32 Windows API functions using ctypes.
@@ -56,6 +248,12 @@ class Kernel32:
         """
         self.__kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
         self.__configure_kernel32_functions()
+        # Read buffers shared by every pipe read through this wrapper
+        self.buffer_pool = BufferPool()
+        # Callback ids of the registered waits, by wait handle
+        self.__wait_ids = {}
+        # Per-thread DWORD reused for out parameters that are read right after the call
+        self.__scratch = threading.local()
 
     def __configure_kernel32_functions(self):
         """
@@ -78,6 +276,15 @@ class Kernel32:
         ]
         self.__kernel32.ReadFile.restype = wintypes.BOOL
 
+        self.__kernel32.WriteFile.argtypes = [
+            wintypes.HANDLE,
+            ctypes.c_void_p,
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(Overlapped)
+        ]
+        self.__kernel32.WriteFile.restype = wintypes.BOOL
+
         self.__kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
         self.__kernel32.CloseHandle.restype = wintypes.BOOL
 
@@ -90,54 +297,346 @@ class Kernel32:
         self.__kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
         self.__kernel32.TerminateProcess.restype = wintypes.BOOL
 
-    def create_pipe(self) -> Tuple[wintypes.HANDLE, wintypes.HANDLE]:
+        self.__kernel32.GetOverlappedResult.argtypes = [
+            wintypes.HANDLE,
+            ctypes.POINTER(Overlapped),
+            ctypes.POINTER(wintypes.DWORD),
+            wintypes.BOOL
+        ]
+        self.__kernel32.GetOverlappedResult.restype = wintypes.BOOL
+
+        self.__kernel32.CreateNamedPipeW.argtypes = [
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            ctypes.POINTER(SecurityAttributes)
+        ]
+        self.__kernel32.CreateNamedPipeW.restype = wintypes.HANDLE
+
+        self.__kernel32.CreateFileW.argtypes = [
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            ctypes.POINTER(SecurityAttributes),
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.HANDLE
+        ]
+        self.__kernel32.CreateFileW.restype = wintypes.HANDLE
+
+        self.__kernel32.CreateEventW.argtypes = [
+            ctypes.POINTER(SecurityAttributes),
+            wintypes.BOOL,
+            wintypes.BOOL,
+            wintypes.LPCWSTR
+        ]
+        self.__kernel32.CreateEventW.restype = wintypes.HANDLE
+
+        self.__kernel32.WaitForMultipleObjects.argtypes = [
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.HANDLE),
+            wintypes.BOOL,
+            wintypes.DWORD
+        ]
+        self.__kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+
+        self.__kernel32.CancelIo.argtypes = [wintypes.HANDLE]
+        self.__kernel32.CancelIo.restype = wintypes.BOOL
+
+        self.__kernel32.PeekNamedPipe.argtypes = [
+            wintypes.HANDLE,
+            ctypes.c_void_p,
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(wintypes.DWORD)
+        ]
+        self.__kernel32.PeekNamedPipe.restype = wintypes.BOOL
+
+        self.__kernel32.RegisterWaitForSingleObject.argtypes = [
+            ctypes.POINTER(wintypes.HANDLE),
+            wintypes.HANDLE,
+            WAITORTIMERCALLBACK,
+            ctypes.c_void_p,
+            wintypes.ULONG,
+            wintypes.ULONG
+        ]
+        self.__kernel32.RegisterWaitForSingleObject.restype = wintypes.BOOL
+
+        self.__kernel32.UnregisterWait.argtypes = [wintypes.HANDLE]
+        self.__kernel32.UnregisterWait.restype = wintypes.BOOL
+
+        self.__kernel32.SetHandleInformation.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD]
+        self.__kernel32.SetHandleInformation.restype = wintypes.BOOL
+
+        self.__kernel32.CreateIoCompletionPort.argtypes = [
+            wintypes.HANDLE,
+            wintypes.HANDLE,
+            ctypes.c_size_t,
+            wintypes.DWORD
+        ]
+        self.__kernel32.CreateIoCompletionPort.restype = wintypes.HANDLE
+
+        self.__kernel32.GetQueuedCompletionStatus.argtypes = [
+            wintypes.HANDLE,
+            ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(ctypes.c_size_t),
+            ctypes.POINTER(ctypes.c_void_p),
+            wintypes.DWORD
+        ]
+        self.__kernel32.GetQueuedCompletionStatus.restype = wintypes.BOOL
+
+        # Bind the configured functions once so the wrappers skip the DLL attribute lookup
+        self._CreatePipe = self.__kernel32.CreatePipe
+        self._ReadFile = self.__kernel32.ReadFile
+        self._WriteFile = self.__kernel32.WriteFile
+        self._CloseHandle = self.__kernel32.CloseHandle
+        self._WaitForSingleObject = self.__kernel32.WaitForSingleObject
+        self._GetExitCodeProcess = self.__kernel32.GetExitCodeProcess
+        self._TerminateProcess = self.__kernel32.TerminateProcess
+        self._GetOverlappedResult = self.__kernel32.GetOverlappedResult
+        self._CreateNamedPipeW = self.__kernel32.CreateNamedPipeW
+        self._CreateFileW = self.__kernel32.CreateFileW
+        self._CreateEventW = self.__kernel32.CreateEventW
+        self._WaitForMultipleObjects = self.__kernel32.WaitForMultipleObjects
+        self._CancelIo = self.__kernel32.CancelIo
+        self._PeekNamedPipe = self.__kernel32.PeekNamedPipe
+        self._RegisterWaitForSingleObject = self.__kernel32.RegisterWaitForSingleObject
+        self._UnregisterWait = self.__kernel32.UnregisterWait
+        self._SetHandleInformation = self.__kernel32.SetHandleInformation
+        self._CreateIoCompletionPort = self.__kernel32.CreateIoCompletionPort
+        self._GetQueuedCompletionStatus = self.__kernel32.GetQueuedCompletionStatus
+
+    def __scratch_dword(self) -> wintypes.DWORD:
+        """
+        Return the calling thread's reusable DWORD, so a shared instance can be used from several threads.
+        """
+        try:
+            return self.__scratch.dword
+        except AttributeError:
+            dword = self.__scratch.dword = wintypes.DWORD()
+            return dword
+
+    def create_pipe(self, buffer_size: int = DEFAULT_READ_SIZE, inherit_read: bool = True,
+                    inherit_write: bool = True) -> Tuple[wintypes.HANDLE, wintypes.HANDLE]:
         """
         Create an anonymous pipe with handle inheritance enabled.
 
+        The end kept by the parent should not be inheritable, otherwise every process launched while the
+        pipe is open gets a copy of it and the pipe may never report EOF; the pipe is created inheritable
+        and inheritance is then cleared on the ends that must not be passed on.
+
+        The system default buffer (a few KiB) makes a chatty writer block and the reader issue many
+        small reads; 64 KiB is the empirically best size for pipes on Windows, larger buffers only
+        cost nonpaged pool memory without reducing the number of reads further.
+
+        Args:
+            buffer_size (int): Suggested pipe buffer size in bytes, 0 for the system default
+                (default: DEFAULT_READ_SIZE).
+            inherit_read (bool): Whether the read end is inheritable (default: True).
+            inherit_write (bool): Whether the write end is inheritable (default: True).
         Returns:
             Tuple[wintypes.HANDLE, wintypes.HANDLE]: (read_handle, write_handle)
         Raises:
-            WindowsError: If the pipe creation fails.
+            Kernel32Error: If the pipe creation fails.
         """
         sa = SecurityAttributes()
-        sa.nLength = ctypes.sizeof(SecurityAttributes)
+        sa.nLength = SecurityAttributes._SIZE
         sa.lpSecurityDescriptor = None
-        sa.bInheritHandle = wintypes.BOOL(True)
+        sa.bInheritHandle = True
 
         read_handle = wintypes.HANDLE()
         write_handle = wintypes.HANDLE()
 
-        if not self.__kernel32.CreatePipe(
-                ctypes.byref(read_handle),
-                ctypes.byref(write_handle),
-                ctypes.byref(sa),
-                0
+        if not self._CreatePipe(
+                read_handle,
+                write_handle,
+                sa,
+                buffer_size
         ):
-            raise ctypes.WinError(ctypes.get_last_error())
+            raise Kernel32Error(ctypes.get_last_error())
+
+        for handle, inherit in ((read_handle, inherit_read), (write_handle, inherit_write)):
+            if not inherit and not self._SetHandleInformation(handle, HANDLE_FLAG_INHERIT, 0):
+                error = ctypes.get_last_error()
+                self._CloseHandle(read_handle)
+                self._CloseHandle(write_handle)
+                raise Kernel32Error(error)
 
         return read_handle, write_handle
 
-    def read_file(self, pipe_handle: wintypes.HANDLE, buffer, overlapped) -> bool:
+    def create_overlapped_pipe(self, buffer_size: int = DEFAULT_READ_SIZE) -> Tuple[wintypes.HANDLE, wintypes.HANDLE]:
+        """
+        Create a pipe whose read end supports overlapped I/O.
+
+        Anonymous pipes do not support overlapped reads, so a uniquely named pipe is used instead.
+        The read end is opened with FILE_FLAG_OVERLAPPED and is not inheritable; the write end is
+        a synchronous, inheritable handle suitable for a child process.
+
+        Args:
+            buffer_size (int): Suggested pipe buffer size in bytes, 0 for the system default
+                (default: DEFAULT_READ_SIZE).
+        Returns:
+            Tuple[wintypes.HANDLE, wintypes.HANDLE]: (read_handle, write_handle)
+        Raises:
+            Kernel32Error: If the pipe creation fails.
+        """
+        name = rf"\\.\pipe\py4wsl-{os.getpid()}-{next(_pipe_counter)}"
+
+        read_handle = self._CreateNamedPipeW(
+            name,
+            PIPE_ACCESS_INBOUND | FILE_FLAG_OVERLAPPED | FILE_FLAG_FIRST_PIPE_INSTANCE,
+            0,
+            1,
+            buffer_size,
+            buffer_size,
+            0,
+            None
+        )
+        if read_handle == INVALID_HANDLE_VALUE:
+            raise Kernel32Error(ctypes.get_last_error())
+
+        sa = SecurityAttributes()
+        sa.nLength = SecurityAttributes._SIZE
+        sa.lpSecurityDescriptor = None
+        sa.bInheritHandle = True
+
+        write_handle = self._CreateFileW(name, GENERIC_WRITE, 0, sa, OPEN_EXISTING, 0, None)
+        if write_handle == INVALID_HANDLE_VALUE:
+            error = ctypes.get_last_error()
+            self._CloseHandle(read_handle)
+            raise Kernel32Error(error)
+
+        return wintypes.HANDLE(read_handle), wintypes.HANDLE(write_handle)
+
+    def create_event(self, manual_reset: bool = True, initial_state: bool = False) -> wintypes.HANDLE:
+        """
+        Create an unnamed event object.
+
+        Args:
+            manual_reset (bool): Whether the event must be reset manually (default: True).
+            initial_state (bool): Whether the event starts signaled (default: False).
+        Returns:
+            wintypes.HANDLE: Handle to the event.
+        Raises:
+            Kernel32Error: If the event creation fails.
+        """
+        event = self._CreateEventW(None, manual_reset, initial_state, None)
+        if not event:
+            raise Kernel32Error(ctypes.get_last_error())
+        return wintypes.HANDLE(event)
+
+    def read_file(self, pipe_handle: wintypes.HANDLE, buffer, overlapped, buffer_size: Optional[int] = None) -> bool:
         """
         Read data from a file or pipe handle.
 
         Args:
             pipe_handle (wintypes.HANDLE): Handle to the file or pipe.
-            buffer: Buffer to receive the data.
+            buffer: Buffer to receive the data (ctypes.create_string_buffer).
             overlapped: OVERLAPPED structure for asynchronous operations.
+            buffer_size (Optional[int]): Number of bytes to read (default: len(buffer)).
         Returns:
             bool: True if successful, False otherwise.
         """
-        bytes_read = wintypes.DWORD()
+        # With an OVERLAPPED structure the count comes from get_overlapped_result, so none is requested
+        bytes_read = None if overlapped is not None else self.__scratch_dword()
 
-        return self.__kernel32.ReadFile(
+        return self._ReadFile(
             pipe_handle,
             buffer,
-            ctypes.sizeof(buffer),
-            ctypes.byref(bytes_read),
-            ctypes.byref(overlapped)
+            buffer_size or len(buffer),
+            bytes_read,
+            overlapped
         )
 
+    def read_file_sync(self, pipe_handle: wintypes.HANDLE, buffer, buffer_size: Optional[int] = None) -> int:
+        """
+        Synchronously read data from a file or pipe handle not opened for overlapped I/O.
+
+        Args:
+            pipe_handle (wintypes.HANDLE): Handle to the file or pipe.
+            buffer: Buffer to receive the data (ctypes.create_string_buffer).
+            buffer_size (Optional[int]): Maximum number of bytes to read (default: len(buffer)).
+        Returns:
+            int: Number of bytes read, 0 at end of file.
+        Raises:
+            Kernel32Error: If the read fails, ERROR_BROKEN_PIPE included.
+        """
+        bytes_read = self.__scratch_dword()
+        if not self._ReadFile(pipe_handle, buffer, buffer_size or len(buffer), bytes_read, None):
+            raise Kernel32Error(ctypes.get_last_error())
+        return bytes_read.value
+
+    def peek_named_pipe(self, pipe_handle: wintypes.HANDLE) -> int:
+        """
+        Get the number of bytes that can be read from a pipe without blocking.
+
+        Args:
+            pipe_handle (wintypes.HANDLE): Handle to the read end of the pipe.
+        Returns:
+            int: Number of bytes available.
+        Raises:
+            Kernel32Error: If the pipe can not be queried (e.g. ERROR_BROKEN_PIPE once the writer is gone).
+        """
+        available = self.__scratch_dword()
+        if not self._PeekNamedPipe(pipe_handle, None, 0, None, available, None):
+            raise Kernel32Error(ctypes.get_last_error())
+        return available.value
+
+    def drain_pipe(self, pipe_handle: wintypes.HANDLE, max_bytes: int = 1 << 20,
+                   overlapped: Optional[Overlapped] = None) -> bytes:
+        """
+        Read everything currently queued in a pipe with a single ReadFile sized to the available bytes.
+
+        Args:
+            pipe_handle (wintypes.HANDLE): Handle to the read end of the pipe.
+            max_bytes (int): Upper bound for the read (default: 1 MiB).
+            overlapped (Optional[Overlapped]): OVERLAPPED structure, required if the handle was opened for
+                overlapped I/O; it must not have a read in flight.
+        Returns:
+            bytes: The data read, empty if nothing was queued.
+        Raises:
+            Kernel32Error: If the pipe can not be queried or read.
+        """
+        available = min(self.peek_named_pipe(pipe_handle), max_bytes)
+        if not available:
+            return b""
+
+        buffer = ctypes.create_string_buffer(available)
+        if overlapped is None:
+            return buffer[:self.read_file_sync(pipe_handle, buffer)]
+
+        if not self._ReadFile(pipe_handle, buffer, available, None, overlapped):
+            error = ctypes.get_last_error()
+            if error != ErrorCode.IO_PENDING:
+                raise Kernel32Error(error)
+        return buffer[:self.get_overlapped_result(pipe_handle, overlapped, wait=True)]
+
+    def write_file(self, pipe_handle: wintypes.HANDLE, data: bytes) -> int:
+        """
+        Synchronously write all the given bytes to a file or pipe handle.
+
+        Args:
+            pipe_handle (wintypes.HANDLE): Handle to the file or pipe.
+            data (bytes): Data to write.
+        Returns:
+            int: Number of bytes written.
+        Raises:
+            Kernel32Error: If the write fails.
+        """
+        bytes_written = self.__scratch_dword()
+        total = 0
+        while total < len(data):
+            chunk = data[total:]
+            if not self._WriteFile(pipe_handle, chunk, len(chunk), bytes_written, None):
+                raise Kernel32Error(ctypes.get_last_error())
+            total += bytes_written.value
+        return total
+
     def get_overlapped_result(self, pipe_handle: wintypes.HANDLE, overlapped: Overlapped, wait: bool = True) -> int:
         """
         Retrieve the result of an overlapped (asynchronous) operation.
@@ -149,17 +648,17 @@ class Kernel32:
         Returns:
             int: Number of bytes transferred.
         Raises:
-            WindowsError: If the operation fails.
+            Kernel32Error: If the operation fails.
         """
-        bytes_transferred = wintypes.DWORD()
-        result = self.__kernel32.GetOverlappedResult(
+        bytes_transferred = self.__scratch_dword()
+        result = self._GetOverlappedResult(
             pipe_handle,
-            ctypes.byref(overlapped),
-            ctypes.byref(bytes_transferred),
-            wintypes.BOOL(wait)
+            overlapped,
+            bytes_transferred,
+            wait
         )
         if not result:
-            raise ctypes.WinError(ctypes.get_last_error())
+            raise Kernel32Error(ctypes.get_last_error())
         return bytes_transferred.value
 
     def close_handle(self, pipe_handle: wintypes.HANDLE) -> bool:
@@ -171,7 +670,7 @@ class Kernel32:
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self.__kernel32.CloseHandle(pipe_handle)
+        return self._CloseHandle(pipe_handle)
 
     def wait_for_single_object(self, process_handle: wintypes.HANDLE, timeout=30000) -> WaitResult:
         """
@@ -183,7 +682,124 @@ class Kernel32:
         Returns:
             WaitResult: Result of the wait operation.
         """
-        return self.__kernel32.WaitForSingleObject(process_handle, timeout)
+        return self._WaitForSingleObject(process_handle, timeout)
+
+    def wait_for_multiple_objects(self, handles: Sequence[wintypes.HANDLE], wait_all: bool = False,
+                                  timeout=30000) -> int:
+        """
+        Wait until one (or all) of the specified objects is signaled or the time-out interval elapses.
+
+        Args:
+            handles (Sequence[wintypes.HANDLE]): Handles to wait on (at most 64).
+            wait_all (bool): Wait for all the objects instead of any of them (default: False).
+            timeout (int): Time-out interval in milliseconds (default: 30000).
+        Returns:
+            int: WaitResult.OBJECT_0 plus the index of the signaled handle, WaitResult.TIMEOUT or WaitResult.FAILED.
+        """
+        handle_array = (wintypes.HANDLE * len(handles))(*handles)
+        return self._WaitForMultipleObjects(len(handles), handle_array, wait_all, timeout)
+
+    def register_wait(self, handle: wintypes.HANDLE, callback: Callable[[bool], None],
+                      timeout=INFINITE) -> wintypes.HANDLE:
+        """
+        Have the system thread pool call a function once the object is signaled, without blocking a thread.
+
+        The callback runs once, on a thread-pool thread, with True if the time-out elapsed and False if
+        the object was signaled. The returned wait handle must be released with unregister_wait.
+
+        Args:
+            handle (wintypes.HANDLE): Handle to the object (e.g. a process handle).
+            callback (Callable[[bool], None]): Function called with the timed-out flag.
+            timeout (int): Time-out interval in milliseconds (default: INFINITE).
+        Returns:
+            wintypes.HANDLE: Wait handle.
+        Raises:
+            Kernel32Error: If the wait can not be registered.
+        """
+        wait_id = next(_wait_ids)
+        _wait_callbacks[wait_id] = callback
+        wait_handle = wintypes.HANDLE()
+        if not self._RegisterWaitForSingleObject(
+                wait_handle, handle, _wait_callback, wait_id, timeout, WT_EXECUTEONLYONCE
+        ):
+            _wait_callbacks.pop(wait_id, None)
+            raise Kernel32Error(ctypes.get_last_error())
+        self.__wait_ids[wait_handle.value] = wait_id
+        return wait_handle
+
+    def unregister_wait(self, wait_handle: wintypes.HANDLE) -> bool:
+        """
+        Release a wait registered with register_wait, cancelling it if the callback did not run yet.
+
+        It must be called for every registered wait, also after the callback ran, and may be called
+        from the callback itself.
+
+        Args:
+            wait_handle (wintypes.HANDLE): Wait handle returned by register_wait.
+        Returns:
+            bool: True if the wait was released or will be once the running callback returns
+            (ERROR_IO_PENDING), False otherwise.
+        """
+        wait_id = self.__wait_ids.pop(wait_handle.value, None)
+        if self._UnregisterWait(wait_handle):
+            _wait_callbacks.pop(wait_id, None)
+            return True
+        return ctypes.get_last_error() == ErrorCode.IO_PENDING
+
+    def create_io_completion_port(self, file_handle=INVALID_HANDLE_VALUE, existing_port=None, key: int = 0,
+                                  concurrent_threads: int = 0) -> wintypes.HANDLE:
+        """
+        Create an I/O completion port or associate a handle with an existing one.
+
+        Args:
+            file_handle (wintypes.HANDLE): Handle opened for overlapped I/O, or INVALID_HANDLE_VALUE to only
+                create a port (default).
+            existing_port (wintypes.HANDLE): Port to associate the handle with, None to create a new one.
+            key (int): Completion key reported with every completion of the handle (default: 0).
+            concurrent_threads (int): Threads allowed to process completions concurrently, 0 for as many
+                as processors (default: 0).
+        Returns:
+            wintypes.HANDLE: Handle to the completion port.
+        Raises:
+            Kernel32Error: If the port can not be created or the handle associated.
+        """
+        port = self._CreateIoCompletionPort(file_handle, existing_port, key, concurrent_threads)
+        if not port:
+            raise Kernel32Error(ctypes.get_last_error())
+        return wintypes.HANDLE(port)
+
+    def get_queued_completion_status(self, port: wintypes.HANDLE,
+                                     timeout=INFINITE) -> Tuple[int, int, int, Optional[int]]:
+        """
+        Dequeue one completion packet from a completion port.
+
+        Args:
+            port (wintypes.HANDLE): Handle to the completion port.
+            timeout (int): Time-out interval in milliseconds (default: INFINITE).
+        Returns:
+            Tuple[int, int, int, Optional[int]]: (error code, bytes transferred, completion key, address of
+            the OVERLAPPED structure). The error code is 0 for a successful operation and the Win32 error of
+            a failed one; the address is None if nothing was dequeued (ErrorCode.WAIT_TIMEOUT on time-out).
+        """
+        bytes_transferred = wintypes.DWORD()
+        key = ctypes.c_size_t()
+        overlapped = ctypes.c_void_p()
+        if self._GetQueuedCompletionStatus(port, bytes_transferred, key, overlapped, timeout):
+            error = 0
+        else:
+            error = ctypes.get_last_error()
+        return error, bytes_transferred.value, key.value, overlapped.value
+
+    def cancel_io(self, pipe_handle: wintypes.HANDLE) -> bool:
+        """
+        Cancel the pending I/O operations issued by the calling thread on a handle.
+
+        Args:
+            pipe_handle (wintypes.HANDLE): Handle to the file or pipe.
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        return self._CancelIo(pipe_handle)
 
     def get_exit_code_process(self, process_handle: wintypes.HANDLE) -> Optional[int]:
         """
@@ -194,8 +810,8 @@ class Kernel32:
         Returns:
             Optional[int]: Exit code if successful, None otherwise.
         """
-        exit_code = wintypes.DWORD()
-        return exit_code.value if self.__kernel32.GetExitCodeProcess(process_handle, ctypes.byref(exit_code)) else None
+        exit_code = self.__scratch_dword()
+        return exit_code.value if self._GetExitCodeProcess(process_handle, exit_code) else None
 
     def terminate_process(self, process_handle: wintypes.HANDLE, exit_code: int = 1) -> bool:
         """
@@ -207,4 +823,15 @@ class Kernel32:
         Returns:
             bool: True if successful, False otherwise.
         """
-        return self.__kernel32.TerminateProcess(process_handle, exit_code)
+        return self._TerminateProcess(process_handle, exit_code)
+
+
+@functools.lru_cache(maxsize=None)
+def get_kernel32() -> Kernel32:
+    """
+    Return the process-wide Kernel32 wrapper, configuring its functions on first use.
+
+    Returns:
+        Kernel32: Shared wrapper instance.
+    """
+    return Kernel32()
@@ -3,6 +3,7 @@ This module provides a Python wrapper for selected functions from the Windows OL
 It currently supports memory management via CoTaskMemFree.
 """
 import ctypes
+import functools
 from typing import Any
 
 
@@ -27,6 +28,9 @@ class Ole32:
         self.__ole32.CoTaskMemFree.argtypes = [ctypes.c_void_p]
         self.__ole32.CoTaskMemFree.restype = None
 
+        # Bind the configured functions once so the wrappers skip the DLL attribute lookup
+        self._CoTaskMemFree = self.__ole32.CoTaskMemFree
+
     def co_task_mem_free(self, mem_buffer: Any) -> None:
         """
         Frees a memory buffer allocated by OLE functions.
@@ -34,4 +38,15 @@ class Ole32:
         Args:
             mem_buffer (Any): The memory buffer to be freed.
         """
-        self.__ole32.CoTaskMemFree(mem_buffer)
+        self._CoTaskMemFree(mem_buffer)
+
+
+@functools.lru_cache(maxsize=None)
+def get_ole32() -> Ole32:
+    """
+    Return the process-wide Ole32 wrapper, configuring its functions on first use.
+
+    Returns:
+        Ole32: Shared wrapper instance.
+    """
+    return Ole32()
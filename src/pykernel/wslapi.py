@@ -6,16 +6,23 @@ This module provides a Python interface to the Windows Subsystem for Linux (WSL)
 Classes:
     WslHResult: HRESULT codes for WSL API operations.
     WslDistributionFlags: Flags for WSL distribution configuration.
-    DistributionConfig: Data class for WSL distribution configuration.
+    DistributionConfig: Immutable record for WSL distribution configuration.
     WslAPI: Main class for interacting with the WSL API.
 """
 import ctypes
+import functools
+from concurrent.futures import Future
 from ctypes import wintypes
-from dataclasses import dataclass
 from enum import IntEnum, IntFlag
-from typing import Tuple, Optional, Dict, Any
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
-from pykernel import ole32
+from pykernel import kernel32, ole32
+
+# Raw HRESULT value compared on the hot paths; IntEnum equality goes through Python code
+_S_OK = 0x00000000
+
+# Number of distinct distribution names kept encoded by WslAPI before the cache is reset
+_WIDE_STRING_CACHE_SIZE = 128
 
 
 class WslHResult(IntEnum):
@@ -38,21 +45,25 @@ class WslDistributionFlags(IntFlag):
     WSL2 = 0X8
 
 
-@dataclass
-class DistributionConfig:
+class DistributionConfig(NamedTuple):
     """
-    Data class representing the configuration of a WSL distribution.
+    Immutable record representing the configuration of a WSL distribution.
+
+    A NamedTuple rather than a dataclass: instances carry no __dict__ and the package still supports
+    Python 3.9, where dataclass(slots=True) is not available.
 
     Attributes:
         version (int): WSL version.
         uid (int): Default user ID.
         flags (WslDistributionFlags): Distribution flags.
         env_vars (Optional[Dict[str, Any]]): Environment variables.
+        raw_flags (int): Distribution flags as a plain int, for callers that only test bits.
     """
     version: int
     uid: int
     flags: WslDistributionFlags
     env_vars: Optional[Dict[str, Any]] = None
+    raw_flags: int = 0
 
 
 class WslAPI:
@@ -68,7 +79,10 @@ class WslAPI:
         """
         self.__wslapi = ctypes.WinDLL("wslapi.dll")
         self.__configure_wslapi_functions()
-        self.__ole32py = ole32.Ole32()
+        # ole32.dll is only needed to free configuration data; loaded on first use
+        self.__ole32py = None
+        # UTF-16 copies of the distribution names passed to the API, encoded once
+        self.__wide_strings = {}
 
     def __configure_wslapi_functions(self):
         """
@@ -113,7 +127,8 @@ class WslAPI:
             ctypes.POINTER(wintypes.ULONG),
             ctypes.POINTER(wintypes.ULONG),
             ctypes.POINTER(wintypes.ULONG),
-            ctypes.POINTER(ctypes.c_void_p)
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)),
+            ctypes.POINTER(wintypes.ULONG)
         ]
         self.__wslapi.WslGetDistributionConfiguration.restype = ctypes.HRESULT
 
@@ -125,6 +140,38 @@ class WslAPI:
         ]
         self.__wslapi.WslLaunchInteractive.restype = ctypes.HRESULT
 
+        # Bind the configured functions once so the wrappers skip the DLL attribute lookup
+        self._WslLaunch = self.__wslapi.WslLaunch
+        self._WslRegisterDistribution = self.__wslapi.WslRegisterDistribution
+        self._WslUnregisterDistribution = self.__wslapi.WslUnregisterDistribution
+        self._WslIsDistributionRegistered = self.__wslapi.WslIsDistributionRegistered
+        self._WslConfigureDistribution = self.__wslapi.WslConfigureDistribution
+        self._WslGetDistributionConfiguration = self.__wslapi.WslGetDistributionConfiguration
+        self._WslLaunchInteractive = self.__wslapi.WslLaunchInteractive
+
+    @property
+    def _ole32(self) -> ole32.Ole32:
+        """
+        Shared Ole32 wrapper, loaded the first time it is needed.
+        """
+        if self.__ole32py is None:
+            self.__ole32py = ole32.get_ole32()
+        return self.__ole32py
+
+    def __wide(self, value: Optional[str]) -> Optional[ctypes.Array]:
+        """
+        Return a cached wide-character buffer holding the given distribution name, or None (NULL)
+        for None. Commands are not cached: they are rarely repeated and passed as plain str.
+        """
+        if value is None:
+            return None
+        buffer = self.__wide_strings.get(value)
+        if buffer is None:
+            if len(self.__wide_strings) >= _WIDE_STRING_CACHE_SIZE:
+                self.__wide_strings.clear()
+            buffer = self.__wide_strings[value] = ctypes.create_unicode_buffer(value)
+        return buffer
+
     def wsl_launch(self, distribution_name: str, command: str, std_out: wintypes.HANDLE, std_in: wintypes.HANDLE,
                    std_err: wintypes.HANDLE, process_handle: wintypes.HANDLE,
                    use_current_working_directory: bool = True) -> WslHResult:
@@ -143,10 +190,62 @@ class WslAPI:
         Returns:
             WslHResult: Result code from the WSL API.
         """
-        return self.__wslapi.WslLaunch(
-            distribution_name, command, use_current_working_directory, std_in, std_out, std_err, process_handle
+        return self._WslLaunch(
+            self.__wide(distribution_name), command, use_current_working_directory,
+            std_in, std_out, std_err, process_handle
         )
 
+    def wsl_launch_async(self, distribution_name: str, command: str, std_in: wintypes.HANDLE,
+                         std_out: wintypes.HANDLE, std_err: wintypes.HANDLE,
+                         use_current_working_directory: bool = True) -> Future:
+        """
+        Launch a process in the specified WSL distribution and get its exit code through a future.
+
+        The process handle is waited on by the system thread pool, so no Python thread is blocked
+        while the process runs; the handle is closed once the process exits.
+
+        Args:
+            distribution_name (str): Name of the WSL distribution.
+            command (str): Command to execute.
+            std_in (wintypes.HANDLE): Handle for standard input.
+            std_out (wintypes.HANDLE): Handle for standard output.
+            std_err (wintypes.HANDLE): Handle for standard error.
+            use_current_working_directory (bool): Whether to use the current working directory.
+
+        Returns:
+            Future: Resolves to the exit code of the process (None if it can not be retrieved), or fails
+            with OSError if the launch fails.
+        """
+        future = Future()
+        # The process can not be cancelled through the future once launched
+        future.set_running_or_notify_cancel()
+        process_handle = wintypes.HANDLE()
+        try:
+            # The HRESULT restype turns a failed launch into OSError
+            self.wsl_launch(
+                distribution_name, command, std_out, std_in, std_err, process_handle, use_current_working_directory
+            )
+        except OSError as e:
+            future.set_exception(e)
+            return future
+
+        kernel = kernel32.get_kernel32()
+
+        def on_exit(_timed_out):
+            exit_code = kernel.get_exit_code_process(process_handle)
+            kernel.close_handle(process_handle)
+            future.set_result(exit_code)
+
+        try:
+            wait_handle = kernel.register_wait(process_handle, on_exit)
+        except OSError as e:
+            kernel.close_handle(process_handle)
+            future.set_exception(e)
+            return future
+        # Runs right away if the process already exited, else from the thread pool once it does
+        future.add_done_callback(lambda _: kernel.unregister_wait(wait_handle))
+        return future
+
     def wsl_register_distribution(self, distribution_name: str, tar_gz_path: str) -> ctypes.HRESULT:
         """
         Register a new WSL distribution from a tar.gz root filesystem.
@@ -158,7 +257,7 @@ class WslAPI:
         Returns:
             ctypes.HRESULT: Result code from the WSL API.
         """
-        return self.__wslapi.WslRegisterDistribution(distribution_name, tar_gz_path)
+        return self._WslRegisterDistribution(distribution_name, tar_gz_path)
 
     def wsl_unregister_distribution(self, distribution_name: str) -> ctypes.HRESULT:
         """
@@ -170,7 +269,7 @@ class WslAPI:
         Returns:
             ctypes.HRESULT: Result code from the WSL API.
         """
-        return self.__wslapi.WslUnregisterDistribution(distribution_name)
+        return self._WslUnregisterDistribution(distribution_name)
 
     def wsl_is_distribution_registered(self, distribution_name: str) -> bool:
         """
@@ -182,7 +281,7 @@ class WslAPI:
         Returns:
             bool: True if registered, False otherwise.
         """
-        return self.__wslapi.WslIsDistributionRegistered(distribution_name)
+        return self._WslIsDistributionRegistered(self.__wide(distribution_name))
 
     def wsl_configure_distribution(self, distribution_name: str, uid: int,
                                    flags: WslDistributionFlags) -> ctypes.HRESULT:
@@ -197,7 +296,7 @@ class WslAPI:
         Returns:
             ctypes.HRESULT: Result code from the WSL API.
         """
-        return self.__wslapi.WslConfigureDistribution(distribution_name, uid, flags)
+        return self._WslConfigureDistribution(self.__wide(distribution_name), uid, flags)
 
     def wsl_get_distribution_configuration(
             self, distribution_name: str) -> Tuple[WslHResult, Optional[DistributionConfig]]:
@@ -213,32 +312,33 @@ class WslAPI:
         version = ctypes.c_ulong()
         uid = ctypes.c_ulong()
         flags = ctypes.c_ulong()
-        env_vars = ctypes.c_void_p()
-        result = self.__wslapi.WslGetDistributionConfiguration(
-            distribution_name,
-            ctypes.byref(version),
-            ctypes.byref(uid),
-            ctypes.byref(flags),
-            ctypes.byref(env_vars)
+        env_vars = ctypes.POINTER(ctypes.c_char_p)()
+        env_count = ctypes.c_ulong()
+        result = self._WslGetDistributionConfiguration(
+            self.__wide(distribution_name),
+            version,
+            uid,
+            flags,
+            env_vars,
+            env_count
         )
         distribution_config = None
-        if result == WslHResult.S_OK:
+        if result == _S_OK:
             env_vars_dict = None
-            env_string = ctypes.cast(env_vars, ctypes.c_wchar_p).value
-            if env_string:
-                env_vars_dict = {}
-                # Parse environment variables from null-separated string
-                raw_vars = env_string.split('\0')
-                for var in raw_vars:
-                    if '=' in var:
-                        key, val = var.split('=', 1)
-                        env_vars_dict[key] = val
-
-            # Free memory allocated by the API
-            self.__ole32py.co_task_mem_free(mem_buffer=env_vars)
+            if env_vars:
+                # The API returns an array of "KEY=value" ANSI strings; each one is read exactly once
+                addresses = ctypes.cast(env_vars, ctypes.POINTER(ctypes.c_void_p))[:env_count.value]
+                entries = (ctypes.string_at(address).decode(errors='replace') for address in addresses if address)
+                env_vars_dict = {key: val for key, sep, val in (var.partition('=') for var in entries) if sep}
+
+                # Free memory allocated by the API: every string and then the array itself
+                for address in addresses:
+                    self._ole32.co_task_mem_free(mem_buffer=address)
+                self._ole32.co_task_mem_free(mem_buffer=env_vars)
 
             distribution_config = DistributionConfig(
-                version=version.value, uid=uid.value, flags=WslDistributionFlags(flags.value), env_vars=env_vars_dict
+                version=version.value, uid=uid.value, flags=WslDistributionFlags(flags.value), env_vars=env_vars_dict,
+                raw_flags=flags.value
             )
         return result, distribution_config
 
@@ -256,7 +356,18 @@ class WslAPI:
             Tuple[WslHResult, Optional[int]]: Result code and exit code (if successful).
         """
         exit_code = wintypes.DWORD()
-        h_result = self.__wslapi.WslLaunchInteractive(
-            distribution_name, command, use_current_working_directory, ctypes.byref(exit_code)
+        h_result = self._WslLaunchInteractive(
+            self.__wide(distribution_name), command, use_current_working_directory, exit_code
         )
-        return h_result, exit_code.value if h_result == WslHResult.S_OK else None
+        return h_result, exit_code.value if h_result == _S_OK else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_wslapi() -> WslAPI:
+    """
+    Return the process-wide WslAPI wrapper, configuring its functions on first use.
+
+    Returns:
+        WslAPI: Shared wrapper instance.
+    """
+    return WslAPI()
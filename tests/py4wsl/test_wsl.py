@@ -0,0 +1,135 @@
+# Tests for the wsl.conf / .wslconfig parser and for the WSL paths that cache or talk to the persistent
+# shell; WslLaunch and the kernel32 calls are mocked, so no distribution is needed
+import ctypes
+from unittest.mock import Mock, patch
+
+import pytest
+from src.py4wsl.wsl import WSL, WSL_CONF_SECTIONS, WSL_IP_TTL, WSLCONFIG_SECTIONS, _parse_ini
+from src.pykernel.kernel32 import WaitResult
+from src.pykernel.wslapi import WslDistributionFlags
+
+
+def test_parse_ini_sections_and_values():
+    text = "[interop]\nenabled = false\n[automount]\nroot = /mnt/\n[user]\ndefault = bob\n"
+    conf = _parse_ini(text, WSL_CONF_SECTIONS)
+    assert conf['interop'] == {'enabled': False}
+    assert conf['automount'] == {'root': '/mnt/'}
+    assert conf['user'] == {'default': 'bob'}
+    assert conf['systemd'] == {}
+
+
+def test_parse_ini_keeps_semicolon_and_hash_in_values():
+    text = "[boot]\ncommand = service docker start; echo hi\n[network]\nhostname = my#host\n"
+    conf = _parse_ini(text, WSL_CONF_SECTIONS)
+    assert conf['boot']['command'] == 'service docker start; echo hi'
+    assert conf['network']['hostname'] == 'my#host'
+
+
+def test_parse_ini_skips_comment_lines():
+    text = "# comment\n[network] # trailing\n; generateHosts = true\ngenerateHosts = false\n"
+    conf = _parse_ini(text, WSL_CONF_SECTIONS)
+    assert conf['network'] == {'generatehosts': False}
+
+
+def test_parse_ini_case_and_coercion():
+    text = "[WSL2]\r\nMemory = 4GB\r\nprocessors = 2\r\nguiApplications = TRUE\r\n[other]\r\nkey = 1\r\n"
+    conf = _parse_ini(text, WSLCONFIG_SECTIONS)
+    assert conf == {'wsl2': {'memory': '4GB', 'processors': 2, 'guiapplications': True}}
+
+
+def test_parse_ini_skips_lines_without_equals():
+    # A bare key must not swallow the next line into its name
+    conf = _parse_ini("[wsl2]\nkernelCommandLine\nmemory = 4GB\n", WSLCONFIG_SECTIONS)
+    assert conf == {'wsl2': {'memory': '4GB'}}
+
+
+def _fake_shell(wsl, chunks, wait_result=WaitResult.OBJECT_0):
+    """Installs a persistent shell whose stdout returns the given chunks, one per overlapped read"""
+    buffer = ctypes.create_string_buffer(64)
+    pending = list(chunks)
+
+    def read_result(pipe_handle, overlapped, wait=True):
+        if not pending:
+            # What a read cancelled by close() reports
+            raise OSError("ERROR_OPERATION_ABORTED")
+        chunk = pending.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    wsl.kernel32py = Mock()
+    wsl.kernel32py.read_file.return_value = True
+    wsl.kernel32py.wait_for_single_object.return_value = wait_result
+    wsl.kernel32py.get_overlapped_result.side_effect = read_result
+    wsl._shell = {
+        "stdin": 1, "stdout": 2, "process": 3, "overlapped": Mock(hEvent=4), "buffer": buffer, "token": b"__END__",
+    }
+
+
+def test_exec_reads_until_end_marker():
+    # The command is followed by a printf of the token and $?; output stops at the token
+    wsl = WSL(persistent_shell=True)
+    _fake_shell(wsl, [b"line 1\nline", b" 2\n__END__", b"7\n"])
+    assert wsl.exec("echo hi") == (b"line 1\nline 2\n", 7)
+    written = wsl.kernel32py.write_file.call_args[0][1]
+    assert written.startswith(b"{ echo hi\n} </dev/null\n")
+    assert written.endswith(b"printf '%s%d\\n' __END__ $?\n")
+    assert wsl._shell is not None
+
+
+def test_exec_timeout_restarts_shell():
+    # A command that does not finish in time returns -1 and drops the shell
+    wsl = WSL(persistent_shell=True)
+    _fake_shell(wsl, [], wait_result=WaitResult.TIMEOUT)
+    assert wsl.exec("sleep 100", timeout=10) == (b"", -1)
+    assert wsl._shell is None
+
+
+def test_configure_distribution_updates_cache():
+    # Both values given: WSL is not queried and the cached configuration is updated in place
+    wsl = WSL()
+    wsl.wsl_api = Mock()
+    wsl.wsl_api.wsl_configure_distribution.return_value = 0
+    wsl._config_cache = {'default_uid': 0, 'flags': WslDistributionFlags.NONE, 'flag_names': ["NONE"]}
+    flags = WslDistributionFlags.ENABLE_INTEROP | WslDistributionFlags.APPEND_NT_PATH
+    assert wsl.configure_distribution(default_uid=1000, flags=flags)
+    wsl.wsl_api.wsl_get_distribution_configuration.assert_not_called()
+    assert wsl.get_distribution_configuration() == {
+        'default_uid': 1000, 'flags': flags, 'flag_names': ["ENABLE_INTEROP", "APPEND_NT_PATH"]
+    }
+
+
+def _launch_result(stdout, exit_code=0):
+    return {"hr": 0, "stdout": stdout, "stderr": b"", "exit_code": exit_code}
+
+
+def test_wsl_ip_cache_and_refresh():
+    # The IP is reused within WSL_IP_TTL, queried again after it or on refresh_ip()
+    wsl = WSL()
+    with patch.object(wsl, '_launch_short', return_value=_launch_result(b"172.20.0.2 10.0.0.1\n")) as launch:
+        assert wsl.get_wsl_ip() == "172.20.0.2"
+        assert wsl.wsl_ip == "172.20.0.2"
+        assert launch.call_count == 1
+
+        launch.return_value = _launch_result(b"172.20.0.3\n")
+        assert wsl.refresh_ip() == "172.20.0.3"
+        assert launch.call_count == 2
+
+        wsl._wsl_ip_time -= WSL_IP_TTL + 1
+        launch.return_value = _launch_result(b"172.20.0.4\n")
+        assert wsl.get_wsl_ip() == "172.20.0.4"
+        assert launch.call_count == 3
+
+    with patch.object(wsl, '_launch_short', return_value=_launch_result(b"")):
+        assert wsl.refresh_ip() is None
+
+
+def test_wsl_user_not_cached_on_failure():
+    # A failed whoami raises and is retried; a successful one is queried once
+    wsl = WSL()
+    with patch.object(wsl, '_launch_short', return_value=_launch_result(b"", exit_code=1)) as launch:
+        with pytest.raises(RuntimeError):
+            _ = wsl.wsl_user
+        launch.return_value = _launch_result(b"bob\n")
+        assert wsl.wsl_user == "bob"
+        assert wsl.wsl_user == "bob"
+        assert launch.call_count == 2
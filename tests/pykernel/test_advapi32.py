@@ -0,0 +1,61 @@
+# Tests for the Advapi32 registry wrapper: change notifications, key enumeration and value queries
+# against keys that exist on every Windows install (HKCU\Software, HKCU\Environment)
+import ctypes
+import winreg
+
+import pytest
+from src.pykernel.advapi32 import Advapi32, ERROR_SUCCESS
+from src.pykernel.kernel32 import Kernel32
+
+
+@pytest.fixture
+def advapi32():
+    return Advapi32()
+
+
+def test_advapi32_init(advapi32):
+    assert isinstance(advapi32, Advapi32)
+
+
+def test_reg_notify_change_key_value(advapi32):
+    # Registering a notification on an existing key must succeed
+    kernel32 = Kernel32()
+    event = kernel32.create_event(manual_reset=False)
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Software", 0, winreg.KEY_NOTIFY) as key:
+        assert advapi32.reg_notify_change_key_value(key, event) == ERROR_SUCCESS
+    assert kernel32.close_handle(event)
+
+
+def test_reg_enum_and_query_value(advapi32):
+    # Enumerate the first subkey of HKCU\Software into a reusable buffer and read a well-known value
+    name_buffer = ctypes.create_unicode_buffer(256)
+    software = advapi32.reg_open_key_ex(winreg.HKEY_CURRENT_USER, "Software")
+    try:
+        assert advapi32.reg_enum_key_ex(software, 0, name_buffer) == ERROR_SUCCESS
+        assert name_buffer.value
+    finally:
+        assert advapi32.reg_close_key(software) == ERROR_SUCCESS
+
+    environment = advapi32.reg_open_key_ex(winreg.HKEY_CURRENT_USER, "Environment")
+    try:
+        assert advapi32.reg_query_value(environment, "TEMP") == winreg.QueryValueEx(
+            winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment"), "TEMP")[0]
+        with pytest.raises(FileNotFoundError):
+            advapi32.reg_query_value(environment, "py4wsl-missing-value")
+    finally:
+        advapi32.reg_close_key(environment)
+
+
+def test_reg_query_multiple_values(advapi32):
+    # All the values come back converted from one call, and a missing one fails the whole call
+    environment = advapi32.reg_open_key_ex(winreg.HKEY_CURRENT_USER, "Environment")
+    try:
+        values = advapi32.reg_query_multiple_values(environment, ["TEMP", "TMP"])
+        assert values == {
+            "TEMP": advapi32.reg_query_value(environment, "TEMP"),
+            "TMP": advapi32.reg_query_value(environment, "TMP")
+        }
+        with pytest.raises(FileNotFoundError):
+            advapi32.reg_query_multiple_values(environment, ["TEMP", "py4wsl-missing-value"])
+    finally:
+        advapi32.reg_close_key(environment)
@@ -1,9 +1,14 @@
 # Dummy tests for generating the test structure
 # These tests are placeholders to establish the testing framework
+import ctypes
+import os
+import threading
 from ctypes import wintypes
 
 import pytest
-from src.pykernel.kernel32 import Kernel32
+from src.pykernel.kernel32 import (
+    BufferPool, CompletionPort, ErrorCode, Kernel32, Kernel32Error, Overlapped, WaitResult, get_kernel32
+)
 
 
 @pytest.fixture
@@ -33,3 +38,141 @@ def test_get_exit_code_process_invalid_handle(kernel32):
     invalid_handle = wintypes.HANDLE(0)
     exit_code = kernel32.get_exit_code_process(invalid_handle)
     assert exit_code is None
+
+
+def test_create_overlapped_pipe(kernel32):
+    # The read end must be usable for overlapped reads and both ends must be closable
+    read_handle, write_handle = kernel32.create_overlapped_pipe()
+    assert isinstance(read_handle, wintypes.HANDLE)
+    assert isinstance(write_handle, wintypes.HANDLE)
+    assert read_handle.value != write_handle.value
+    assert kernel32.close_handle(read_handle)
+    assert kernel32.close_handle(write_handle)
+
+
+def test_wait_for_multiple_objects_signaled_event(kernel32):
+    # The index of the signaled handle is returned relative to WAIT_OBJECT_0
+    pending = kernel32.create_event()
+    signaled = kernel32.create_event(initial_state=True)
+    assert kernel32.wait_for_multiple_objects([pending, signaled], timeout=0) == WaitResult.OBJECT_0 + 1
+    assert kernel32.wait_for_multiple_objects([pending], timeout=0) == WaitResult.TIMEOUT
+    assert kernel32.close_handle(pending)
+    assert kernel32.close_handle(signaled)
+
+
+def test_buffer_pool_reuses_pairs():
+    # Released pairs are handed out again with a zeroed OVERLAPPED, up to max_size idle pairs
+    pool = BufferPool(buffer_size=16, max_size=1)
+    buffer, overlapped = pool.acquire()
+    overlapped.Internal = 1
+    pool.release(buffer, overlapped)
+    # The pool is full, so a second idle pair is dropped
+    pool.release(*BufferPool(buffer_size=16).acquire())
+    assert len(pool) == 1
+    reused_buffer, reused_overlapped = pool.acquire()
+    assert reused_buffer is buffer
+    assert reused_overlapped is overlapped
+    assert reused_overlapped.Internal == 0
+
+
+def test_get_kernel32_returns_shared_instance():
+    # The DLL is loaded and its functions configured only once per process
+    assert get_kernel32() is get_kernel32()
+    assert isinstance(get_kernel32(), Kernel32)
+
+
+def test_completion_port_poll_times_out(kernel32):
+    # Polling a port without queued completions returns no OVERLAPPED and WAIT_TIMEOUT
+    with CompletionPort(kernel32) as port:
+        read_handle, write_handle = kernel32.create_overlapped_pipe()
+        port.attach(read_handle, 7)
+        n_bytes, key, overlapped, error = port.poll(timeout=0)
+        assert overlapped is None
+        assert error == ErrorCode.WAIT_TIMEOUT
+        assert kernel32.close_handle(read_handle)
+        assert kernel32.close_handle(write_handle)
+
+
+def test_kernel32_error_keeps_code():
+    # The error code is available without formatting the message
+    error = Kernel32Error(ErrorCode.BROKEN_PIPE)
+    assert isinstance(error, OSError)
+    assert error.winerror == ErrorCode.BROKEN_PIPE
+    assert str(error).startswith(f"[WinError {int(ErrorCode.BROKEN_PIPE)}]")
+
+
+def test_create_pipe_inheritance_flags(kernel32):
+    # Only the ends passed to the child stay inheritable
+    read_handle, write_handle = kernel32.create_pipe(inherit_read=True, inherit_write=False)
+    try:
+        assert os.get_handle_inheritable(read_handle.value)
+        assert not os.get_handle_inheritable(write_handle.value)
+    finally:
+        kernel32.close_handle(read_handle)
+        kernel32.close_handle(write_handle)
+
+
+def test_read_file_sync(kernel32):
+    # Blocking reads return what was written, then ERROR_BROKEN_PIPE once the writer is closed
+    read_handle, write_handle = kernel32.create_pipe()
+    buffer = ctypes.create_string_buffer(16)
+    try:
+        assert kernel32.write_file(write_handle, b"hello") == 5
+        assert kernel32.read_file_sync(read_handle, buffer) == 5
+        assert buffer[:5] == b"hello"
+        kernel32.close_handle(write_handle)
+        write_handle = None
+        with pytest.raises(Kernel32Error) as excinfo:
+            kernel32.read_file_sync(read_handle, buffer)
+        assert excinfo.value.winerror == ErrorCode.BROKEN_PIPE
+    finally:
+        kernel32.close_handle(read_handle)
+        if write_handle is not None:
+            kernel32.close_handle(write_handle)
+
+
+def test_drain_pipe(kernel32):
+    # Everything queued comes back in one call, up to max_bytes, and an empty pipe gives b""
+    read_handle, write_handle = kernel32.create_pipe()
+    try:
+        assert kernel32.drain_pipe(read_handle) == b""
+        kernel32.write_file(write_handle, b"abc" * 100)
+        assert kernel32.drain_pipe(read_handle, max_bytes=3) == b"abc"
+        assert kernel32.drain_pipe(read_handle) == b"abc" * 99
+    finally:
+        kernel32.close_handle(read_handle)
+        kernel32.close_handle(write_handle)
+
+
+def test_drain_overlapped_pipe(kernel32):
+    # An overlapped read end is drained through the given OVERLAPPED
+    read_handle, write_handle = kernel32.create_overlapped_pipe()
+    overlapped = Overlapped()
+    overlapped.hEvent = kernel32.create_event()
+    try:
+        kernel32.write_file(write_handle, b"data")
+        assert kernel32.drain_pipe(read_handle, overlapped=overlapped) == b"data"
+    finally:
+        kernel32.close_handle(overlapped.hEvent)
+        kernel32.close_handle(read_handle)
+        kernel32.close_handle(write_handle)
+
+
+@pytest.mark.parametrize("signaled, expected_timed_out", [(True, False), (False, True)])
+def test_register_wait(kernel32, signaled, expected_timed_out):
+    # The callback runs once on the thread pool with the timed-out flag
+    event = kernel32.create_event(initial_state=signaled)
+    done = threading.Event()
+    results = []
+
+    def callback(timed_out):
+        results.append(timed_out)
+        done.set()
+
+    wait_handle = kernel32.register_wait(event, callback, timeout=10)
+    try:
+        assert done.wait(5)
+        assert results == [expected_timed_out]
+    finally:
+        assert kernel32.unregister_wait(wait_handle)
+        kernel32.close_handle(event)
@@ -18,6 +18,6 @@ def test_co_task_mem_free_mock():
     # Dummy test for CoTaskMemFree mocking
     # TODO: Implement proper mocking tests with correct attribute access
     ole = Ole32()
-    with patch.object(ole._Ole32__ole32, 'CoTaskMemFree', return_value=None) as mock_free:
+    with patch.object(ole, '_CoTaskMemFree', return_value=None) as mock_free:
         ole.co_task_mem_free(ctypes.c_void_p(1234))
         mock_free.assert_called_once()
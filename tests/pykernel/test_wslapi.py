@@ -1,6 +1,8 @@
 # Dummy tests for generating the test structure
 # These tests are placeholders and should be replaced with proper test implementations
 
+import subprocess
+import sys
 from ctypes import wintypes
 from unittest.mock import patch
 
@@ -20,13 +22,13 @@ def test_wslapi_methods_exist():
     # TODO: Replace with proper method testing with real assertions
     wsl = WslAPI()
     dummy_handle = wintypes.HANDLE(0)
-    with patch.object(wsl._WslAPI__wslapi, 'WslLaunch', return_value=0), \
-            patch.object(wsl._WslAPI__wslapi, 'WslRegisterDistribution', return_value=0), \
-            patch.object(wsl._WslAPI__wslapi, 'WslUnregisterDistribution', return_value=0), \
-            patch.object(wsl._WslAPI__wslapi, 'WslIsDistributionRegistered', return_value=True), \
-            patch.object(wsl._WslAPI__wslapi, 'WslConfigureDistribution', return_value=0), \
-            patch.object(wsl._WslAPI__wslapi, 'WslGetDistributionConfiguration', return_value=0), \
-            patch.object(wsl._WslAPI__wslapi, 'WslLaunchInteractive', return_value=0):
+    with patch.object(wsl, '_WslLaunch', return_value=0), \
+            patch.object(wsl, '_WslRegisterDistribution', return_value=0), \
+            patch.object(wsl, '_WslUnregisterDistribution', return_value=0), \
+            patch.object(wsl, '_WslIsDistributionRegistered', return_value=True), \
+            patch.object(wsl, '_WslConfigureDistribution', return_value=0), \
+            patch.object(wsl, '_WslGetDistributionConfiguration', return_value=0), \
+            patch.object(wsl, '_WslLaunchInteractive', return_value=0):
         try:
             wsl.wsl_launch('dummy', 'ls', dummy_handle, dummy_handle, dummy_handle, dummy_handle)
             wsl.wsl_register_distribution('dummy', 'dummy.tar.gz')
@@ -37,3 +39,40 @@ def test_wslapi_methods_exist():
             wsl.wsl_launch_interactive('dummy', 'ls')
         except Exception as e:
             pytest.fail(f"Un método de WslAPI lanzó una excepción inesperada: {e}")
+
+
+def test_wsl_launch_interactive_without_command():
+    # A None command reaches WslLaunchInteractive as NULL (default shell)
+    wsl = WslAPI()
+    with patch.object(wsl, '_WslLaunchInteractive', return_value=0) as launch:
+        hr, exit_code = wsl.wsl_launch_interactive('dummy', None)
+    assert hr == 0
+    assert exit_code == 0
+    assert launch.call_args[0][1] is None
+
+
+def test_wsl_launch_async_resolves_to_exit_code():
+    # The future resolves from the thread pool once the launched process exits
+    import _winapi
+    wsl = WslAPI()
+    child = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+
+    def launch(distribution_name, command, std_out, std_in, std_err, process_handle, cwd):
+        # Stand in for WslLaunch with a handle of our own to a real process
+        process_handle.value = _winapi.OpenProcess(0x00100000 | 0x1000, False, child.pid)
+        return 0
+
+    dummy_handle = wintypes.HANDLE(0)
+    with patch.object(wsl, 'wsl_launch', side_effect=launch):
+        future = wsl.wsl_launch_async('dummy', 'ls', dummy_handle, dummy_handle, dummy_handle)
+    assert future.result(timeout=10) == 3
+    child.wait()
+
+
+def test_wsl_launch_async_failure_fails_future():
+    # A failed WslLaunch is reported through the future instead of raising
+    wsl = WslAPI()
+    dummy_handle = wintypes.HANDLE(0)
+    with patch.object(wsl, '_WslLaunch', side_effect=OSError("WslLaunch failed")):
+        future = wsl.wsl_launch_async('dummy', 'ls', dummy_handle, dummy_handle, dummy_handle)
+    assert isinstance(future.exception(timeout=0), OSError)